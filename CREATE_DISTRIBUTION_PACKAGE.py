@@ -6,26 +6,108 @@ import os
 import shutil
 from pathlib import Path
 
+KB = 1 << 10
+MB = 1 << 20
+
+# 1 MiB buffer for copying the (large) executable
+COPY_BUFFER_SIZE = MB
+
+
+def format_size(size):
+    """Format a byte count as MB/KB/bytes for the package report."""
+    if size > MB:
+        return f"{size / MB:.1f} MB"
+    if size > KB:
+        return f"{size / KB:.1f} KB"
+    return f"{size} bytes"
+
+
+def copy_large_file(src, dst):
+    """
+    Copy a large file using sendfile where available, falling back to a
+    1 MiB buffered read/write loop. File metadata is preserved like copy2.
+    """
+    read_flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    write_flags = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                   | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+    
+    in_fd = os.open(src, read_flags)
+    try:
+        out_fd = os.open(dst, write_flags, 0o666)
+        try:
+            size = os.fstat(in_fd).st_size
+            copied = 0
+            
+            # Fast path: kernel-side copy (Linux/macOS)
+            if hasattr(os, "sendfile"):
+                try:
+                    while copied < size:
+                        sent = os.sendfile(out_fd, in_fd, copied, size - copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                except OSError:
+                    pass  # Not supported for these descriptors - fall back below
+            
+            # Buffered fallback (Windows, or if sendfile was unavailable)
+            if copied < size:
+                # sendfile() with an offset leaves in_fd's position alone, so
+                # resume both files where it stopped
+                os.lseek(in_fd, copied, os.SEEK_SET)
+                os.lseek(out_fd, copied, os.SEEK_SET)
+                buf = bytearray(COPY_BUFFER_SIZE)
+                view = memoryview(buf)
+                with open(in_fd, "rb", buffering=0, closefd=False) as reader:
+                    while True:
+                        n = reader.readinto(buf)
+                        if not n:
+                            break
+                        written = 0
+                        while written < n:
+                            written += os.write(out_fd, view[written:n])
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    
+    shutil.copystat(src, dst)
+
+
+def is_up_to_date(src_stat, dst):
+    """Return True if dst exists with the same size and mtime as src_stat."""
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    return (src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns)
+
+
 def create_distribution():
     """Create the distribution package."""
     print("Creating JD Power PDF Downloader Distribution Package...")
     
-    # Create distribution directory
+    # Create distribution directory (reused across runs so an unchanged
+    # executable doesn't have to be copied again)
     dist_dir = Path("JDPowerDownloader_v1.0")
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-    dist_dir.mkdir()
+    dist_dir.mkdir(exist_ok=True)
     
     # Copy the executable
     exe_source = Path("dist/JDPowerDownloader.exe")
-    if exe_source.exists():
-        shutil.copy2(exe_source, dist_dir / "JDPowerDownloader.exe")
-        print(f"[OK] Copied JDPowerDownloader.exe ({exe_source.stat().st_size / (1024*1024):.1f} MB)")
-    else:
+    try:
+        exe_stat = os.stat(exe_source)
+    except FileNotFoundError:
         print("[ERROR] JDPowerDownloader.exe not found!")
         return False
     
-    # Copy documentation
+    exe_dest = dist_dir / "JDPowerDownloader.exe"
+    if is_up_to_date(exe_stat, exe_dest):
+        print(f"[OK] JDPowerDownloader.exe is up to date ({format_size(exe_stat.st_size)})")
+    else:
+        copy_large_file(exe_source, exe_dest)
+        print(f"[OK] Copied JDPowerDownloader.exe ({format_size(exe_stat.st_size)})")
+    
+    # Copy documentation (plain content copy - no metadata needed)
     docs_to_copy = [
         "README.txt",
         "TESTING_GUIDE.md", 
@@ -33,11 +115,17 @@ def create_distribution():
         "FINAL_DISTRIBUTION_SUMMARY.md"
     ]
     
+    # One directory read instead of a stat per document
+    with os.scandir(".") as it:
+        present = {entry.name for entry in it if entry.is_file()}
+    
     for doc in docs_to_copy:
-        if Path(doc).exists():
-            shutil.copy2(doc, dist_dir / doc)
+        if doc in present:
+            shutil.copyfile(doc, dist_dir / doc)
             print(f"[OK] Copied {doc}")
         else:
+            # Drop any copy left over from a previous run
+            (dist_dir / doc).unlink(missing_ok=True)
             print(f"[WARNING] {doc} not found")
     
     # Create a simple batch file for easy launching
@@ -60,16 +148,11 @@ JDPowerDownloader.exe
     # Show final package contents
     print(f"\n[PACKAGE] Distribution Package Created: {dist_dir.name}/")
     print("Contents:")
-    for item in sorted(dist_dir.iterdir()):
-        if item.is_file():
-            size = item.stat().st_size
-            if size > 1024*1024:
-                size_str = f"{size / (1024*1024):.1f} MB"
-            elif size > 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size} bytes"
-            print(f"  [FILE] {item.name} ({size_str})")
+    with os.scandir(dist_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for item in entries:
+        if item.is_file(follow_symlinks=False):
+            print(f"  [FILE] {item.name} ({format_size(item.stat().st_size)})")
     
     print(f"\n[SUCCESS] Package ready for distribution!")
     print(f"[LOCATION] {dist_dir.absolute()}")
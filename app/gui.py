@@ -5,12 +5,11 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import queue
 import time
-from datetime import datetime
 
 from app.worker import DownloadWorker
 from app.settings import (
     save_credentials, load_credentials, delete_credentials,
-    save_preferences, load_preferences, save_last_username
+    save_preferences, load_preferences
 )
 from app.utils import (
     validate_credentials, validate_folder,
@@ -18,9 +17,56 @@ from app.utils import (
 )
 
 
+# Virtual event posted by the worker thread whenever it queues a result
+WORKER_RESULT_EVENT = "<<WorkerResult>>"
+
+# Fallback poll interval (ms) in case a wake-up event is missed
+QUEUE_WATCHDOG_MS = 500
+
+
+class NotifyingQueue(queue.Queue):
+    """
+    Result queue that wakes the Tk main loop when an item is put.
+    
+    The GUI only drains the queue when the worker actually sends something,
+    instead of polling it on a fixed timer.
+    """
+    
+    def __init__(self, root):
+        """
+        Initialize the queue.
+        
+        Args:
+            root: Tkinter root window to notify
+        """
+        super().__init__()
+        self.root = root
+    
+    def put(self, item, block=True, timeout=None):
+        """Put an item and post a wake-up event to the GUI thread."""
+        super().put(item, block, timeout)
+        self.notify()
+    
+    def notify(self):
+        """Post a wake-up event to the GUI thread without queuing anything."""
+        try:
+            self.root.event_generate(WORKER_RESULT_EVENT, when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window destroyed or main loop not running - watchdog will drain
+            pass
+
+
 class JDPowerApp:
     """Main GUI application for JD Power PDF Downloader."""
     
+    # Label formatters used by the once-per-second stats refresh
+    TIME_FMT = "Time Elapsed: {}".format
+    SPEED_FMT = "Speed: {:.1f} /hour".format
+    REMAINING_FMT = "Est. Remaining: {}".format
+    SUCCEEDED_FMT = "Succeeded: {}".format
+    FAILED_FMT = "Failed: {}".format
+    DOWNLOADED_FMT = "{} PDFs downloaded".format
+    
     def __init__(self, root):
         """
         Initialize the GUI application.
@@ -44,7 +90,8 @@ class JDPowerApp:
         
         # Worker thread and queue
         self.worker = None
-        self.result_queue = queue.Queue()
+        self.result_queue = NotifyingQueue(self.root)
+        self.root.bind(WORKER_RESULT_EVENT, lambda event: self.drain_queue())
         
         # Progress tracking
         self.start_time = None
@@ -53,6 +100,14 @@ class JDPowerApp:
         self.succeeded = 0
         self.failed = 0
         
+        # Status text queued while draining a batch of results
+        self._pending_status = None
+        
+        # Last values shown by update_stats (to skip redundant redraws)
+        self._last_stats_key = None
+        self._last_rate_processed = 0
+        self._label_text = {}
+        
         # Create GUI
         self.create_widgets()
         self.load_saved_settings()
@@ -283,8 +338,7 @@ class JDPowerApp:
             "num_workers": num_workers,
             "headless": headless,
         })
-        save_preferences(self.prefs)
-        save_last_username(username)
+        save_preferences(self.prefs)  # also persists last_username
         
         # Save or delete credentials
         if save_creds:
@@ -299,6 +353,8 @@ class JDPowerApp:
         self.succeeded = 0
         self.failed = 0
         self.progress_bar["value"] = 0
+        self._last_stats_key = None
+        self._last_rate_processed = 0
         
         # Clear log (activity log removed)
         
@@ -333,8 +389,15 @@ class JDPowerApp:
             # Disable stop button to prevent multiple clicks
             self.stop_btn.config(state="disabled")
     
-    def check_queue(self):
-        """Check the result queue for updates from worker thread."""
+    def drain_queue(self):
+        """
+        Process all result messages currently in the queue.
+        
+        Status text from the whole batch is applied to the label once.
+        """
+        # Progress first, so control messages (e.g. 'complete') see final totals
+        self.drain_progress()
+        
         try:
             while True:  # Process all available messages
                 result = self.result_queue.get_nowait()
@@ -342,9 +405,57 @@ class JDPowerApp:
         except queue.Empty:
             pass
         
-        # Check again in 100ms if worker is still alive
+        self.flush_status()
+    
+    def drain_progress(self):
+        """Apply the newest progress update published by the worker."""
+        worker = self.worker
+        if worker is None or not worker.progress_ready.is_set():
+            return
+        
+        # Clear before reading so an update arriving meanwhile re-sets it
+        worker.progress_ready.clear()
+        latest = None
+        updates = worker.progress_updates
+        try:
+            while True:
+                latest = updates.popleft()
+        except IndexError:
+            pass
+        
+        if latest is not None:
+            # Only the most recent totals matter for the display
+            self.processed = latest.processed
+            self.succeeded = latest.succeeded
+            self.failed = latest.failed
+            
+            # Update progress bar (will be updated in update_stats)
+            
+            # Update status
+            self.set_status(f"Processing vehicle {latest.ref}...")
+    
+    def set_status(self, text):
+        """Queue status label text; applied by flush_status()."""
+        self._pending_status = text
+    
+    def flush_status(self):
+        """Apply the most recent queued status text to the label."""
+        if self._pending_status is not None:
+            self.status_label.config(text=self._pending_status)
+            self._pending_status = None
+    
+    def check_queue(self):
+        """
+        Watchdog for the result queue.
+        
+        Results are normally handled via WORKER_RESULT_EVENT; this only
+        catches anything that arrived without a wake-up event.
+        """
+        self.drain_queue()
+        
+        # Check again while the worker is still alive
         if self.worker and self.worker.is_alive():
-            self.root.after(100, self.check_queue)
+            self.root.after(QUEUE_WATCHDOG_MS, self.check_queue)
     
     def handle_result(self, result):
         """
@@ -363,26 +474,14 @@ class JDPowerApp:
             # Received total count
             self.total_items = result.get('total_items', 0)
             if self.total_items > 0:
-                self.progress_text.config(text=format_progress(0, self.total_items))
-        
-        elif result_type == 'progress':
-            self.processed = result.get('processed', 0)
-            self.succeeded = result.get('succeeded', 0)
-            self.failed = result.get('failed', 0)
-            last_ref = result.get('last_ref', '')
-            status = result.get('status', '')
-            
-            # Update progress bar (will be updated in update_stats)
-            
-            # Vehicle processed
-            
-            # Update status
-            self.status_label.config(text=f"Processing vehicle {last_ref}...")
+                self.set_label_text(self.progress_text, format_progress(0, self.total_items))
         
         elif result_type == 'complete':
-            # Download complete
+            # Download complete - pick up any progress published just before
+            self.drain_progress()
             
-            self.status_label.config(text="Complete!")
+            self.set_status("Complete!")
+            self.flush_status()
             self.start_btn.config(state="normal")
             self.stop_btn.config(state="disabled")
             
@@ -397,7 +496,8 @@ class JDPowerApp:
         elif result_type == 'error':
             error_msg = result.get('message', 'Unknown error')
             # Error occurred
-            self.status_label.config(text="Error occurred")
+            self.set_status("Error occurred")
+            self.flush_status()
             self.start_btn.config(state="normal")
             self.stop_btn.config(state="disabled")
             
@@ -406,11 +506,17 @@ class JDPowerApp:
         elif result_type == 'debug':
             # Debug message - show in status
             debug_msg = result.get('message', '')
-            self.status_label.config(text=f"Debug: {debug_msg}")
+            self.set_status(f"Debug: {debug_msg}")
         
         elif result_type == 'stop_requested':
             # Stopping...
-            self.status_label.config(text="Stop requested - finishing current task...")
+            self.set_status("Stop requested - finishing current task...")
+    
+    def set_label_text(self, label, text):
+        """Configure a label only if its text actually changed."""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.config(text=text)
     
     def update_stats(self):
         """Update statistics labels."""
@@ -419,36 +525,51 @@ class JDPowerApp:
         
         elapsed = time.time() - self.start_time
         
+        # Skip the redraw if neither the displayed second nor progress changed
+        stats_key = (int(elapsed), self.processed, self.total_items)
+        if stats_key != self._last_stats_key:
+            self._last_stats_key = stats_key
+            self._redraw_stats(elapsed)
+        
+        # Update again in 1 second if worker is still alive
+        if self.worker and self.worker.is_alive():
+            self.root.after(1000, self.update_stats)
+    
+    def _redraw_stats(self, elapsed):
+        """
+        Refresh the statistics widgets.
+        
+        Args:
+            elapsed: Seconds since the download started
+        """
         # Update time elapsed
-        self.time_label.config(text=f"Time Elapsed: {format_time(elapsed)}")
+        self.set_label_text(self.time_label, self.TIME_FMT(format_time(elapsed)))
         
-        # Update speed
-        if self.processed > 0:
+        # Update speed (only changes meaningfully when an item completes)
+        if self.processed > 0 and self.processed != self._last_rate_processed:
+            self._last_rate_processed = self.processed
             speed = calculate_speed(self.processed, elapsed)
-            self.speed_label.config(text=f"Speed: {speed:.1f} /hour")
+            self.set_label_text(self.speed_label, self.SPEED_FMT(speed))
             
             # Update estimated remaining time
             if self.total_items > 0:
                 remaining_seconds = estimate_remaining_time(self.processed, self.total_items, elapsed)
                 if remaining_seconds >= 0:
-                    self.remaining_label.config(text=f"Est. Remaining: {format_time(remaining_seconds)}")
+                    self.set_label_text(self.remaining_label,
+                                        self.REMAINING_FMT(format_time(remaining_seconds)))
         
         # Update counters
-        self.success_label.config(text=f"Succeeded: {self.succeeded}")
-        self.failed_label.config(text=f"Failed: {self.failed}")
+        self.set_label_text(self.success_label, self.SUCCEEDED_FMT(self.succeeded))
+        self.set_label_text(self.failed_label, self.FAILED_FMT(self.failed))
         
         # Update progress bar and text
         if self.total_items > 0:
             percentage = (self.processed / self.total_items) * 100
             self.progress_bar["value"] = percentage
-            self.progress_text.config(text=format_progress(self.processed, self.total_items))
+            self.set_label_text(self.progress_text, format_progress(self.processed, self.total_items))
         else:
             # Don't know total yet
-            self.progress_text.config(text=f"{self.processed} PDFs downloaded")
-        
-        # Update again in 1 second if worker is still alive
-        if self.worker and self.worker.is_alive():
-            self.root.after(1000, self.update_stats)
+            self.set_label_text(self.progress_text, self.DOWNLOADED_FMT(self.processed))
     
     # Log method removed - no longer using activity log
     
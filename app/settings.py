@@ -5,10 +5,19 @@ import os
 import json
 from pathlib import Path
 
+# orjson is optional - it parses/serializes straight from/to bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Keyring functionality disabled for standalone executable compatibility
 # This prevents any keyring-related popup errors
 KEYRING_AVAILABLE = False
-keyring = None
+
+# keyring is imported lazily on first credential access (its backends probe
+# the registry/dbus on import, which would slow down GUI startup)
+_keyring = None
 
 
 # Application name for credential storage
@@ -18,12 +27,39 @@ APP_NAME = "JDPowerDownloader"
 SETTINGS_DIR = Path.home() / "AppData" / "Local" / APP_NAME
 SETTINGS_FILE = SETTINGS_DIR / "settings.json"
 
+# Cached preferences, keyed on the settings file's mtime
+_PREFS_CACHE = None
+_PREFS_MTIME = None
+
 
 def ensure_settings_dir():
     """Create settings directory if it doesn't exist."""
     SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _get_keyring():
+    """
+    Import keyring on first use.
+    
+    Returns:
+        module or None: The keyring module, or None if unavailable
+    """
+    global _keyring, KEYRING_AVAILABLE
+    
+    if not KEYRING_AVAILABLE:
+        return None
+    
+    if _keyring is None:
+        try:
+            import keyring
+            _keyring = keyring
+        except ImportError:
+            KEYRING_AVAILABLE = False
+            return None
+    
+    return _keyring
+
+
 def save_credentials(username, password):
     """
     Save credentials securely in Windows Credential Manager.
@@ -35,7 +71,8 @@ def save_credentials(username, password):
     Returns:
         bool: True if successful, False otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = _get_keyring()
+    if keyring is None:
         print("Keyring not available, credentials will not be saved securely")
         return False
         
@@ -57,7 +94,8 @@ def load_credentials(username):
     Returns:
         str or None: Password if found, None otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = _get_keyring()
+    if keyring is None:
         print("Keyring not available, cannot load saved credentials")
         return None
         
@@ -78,7 +116,8 @@ def delete_credentials(username):
     Returns:
         bool: True if successful, False otherwise
     """
-    if not KEYRING_AVAILABLE:
+    keyring = _get_keyring()
+    if keyring is None:
         print("Keyring not available, cannot delete saved credentials")
         return False
         
@@ -100,24 +139,34 @@ def save_preferences(preferences):
     Returns:
         bool: True if successful, False otherwise
     """
+    global _PREFS_CACHE, _PREFS_MTIME
+    
     try:
         ensure_settings_dir()
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(preferences, f, indent=2)
+        
+        # Serialize up front and write in one call to a temp file, then swap
+        # it in so a crash can never leave a truncated settings.json
+        if orjson is not None:
+            data = orjson.dumps(preferences, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(preferences, indent=2).encode("utf-8")
+        tmp_file = SETTINGS_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, 'wb', buffering=0) as f:
+            f.write(data)
+        os.replace(tmp_file, SETTINGS_FILE)
+        
+        # Refresh cache so the next load doesn't re-read the file
+        _PREFS_CACHE = dict(preferences)
+        _PREFS_MTIME = os.stat(SETTINGS_FILE).st_mtime_ns
         return True
     except Exception as e:
         print(f"Error saving preferences: {e}")
         return False
 
 
-def load_preferences():
-    """
-    Load user preferences from JSON file.
-    
-    Returns:
-        dict: Preferences dictionary with defaults if file doesn't exist
-    """
-    defaults = {
+def _default_preferences():
+    """Return the default preferences dictionary."""
+    return {
         "last_username": "",
         "download_folder": str(Path.home() / "Downloads" / "JD_Power_PDFs"),
         "save_credentials": False,
@@ -127,13 +176,37 @@ def load_preferences():
         "window_width": 650,
         "window_height": 750,
     }
+
+
+def load_preferences():
+    """
+    Load user preferences from JSON file.
+    
+    The parsed file is cached and only re-read when its mtime changes.
+    
+    Returns:
+        dict: Preferences dictionary with defaults if file doesn't exist
+    """
+    global _PREFS_CACHE, _PREFS_MTIME
+    
+    try:
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        # No settings file yet
+        return _default_preferences()
+    
+    if _PREFS_CACHE is not None and mtime == _PREFS_MTIME:
+        return dict(_PREFS_CACHE)
     
+    defaults = _default_preferences()
     try:
-        if SETTINGS_FILE.exists():
-            with open(SETTINGS_FILE, 'r') as f:
-                saved_prefs = json.load(f)
-                # Merge with defaults (in case new settings were added)
-                defaults.update(saved_prefs)
+        with open(SETTINGS_FILE, 'rb') as f:
+            raw = f.read()
+        saved_prefs = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        # Merge with defaults (in case new settings were added)
+        defaults.update(saved_prefs)
+        _PREFS_CACHE = dict(defaults)
+        _PREFS_MTIME = mtime
     except Exception as e:
         print(f"Error loading preferences: {e}")
     
@@ -158,7 +231,11 @@ def save_last_username(username):
     Args:
         username: Username to save
     """
+    # load_preferences() checks the file's mtime, so edits made on disk since
+    # the cache was filled aren't overwritten (a fresh cache costs one stat)
     prefs = load_preferences()
+    if prefs.get("last_username") == username:
+        return
     prefs["last_username"] = username
     save_preferences(prefs)
 
@@ -3,6 +3,14 @@ Utility functions for the GUI application.
 """
 import os
 from datetime import timedelta
+from functools import lru_cache
+
+
+# Last folder that passed validate_folder (repeat Start clicks skip the probe)
+_LAST_VALID_FOLDER = None
+
+# Name of the temporary file used to probe folder writability
+_WRITE_PROBE_NAME = ".jdp_write_test"
 
 
 def validate_credentials(username, password):
@@ -35,19 +43,42 @@ def validate_folder(folder_path):
     Returns:
         tuple: (is_valid, error_message)
     """
+    global _LAST_VALID_FOLDER
+    
     if not folder_path or not folder_path.strip():
         return False, "Please select a download folder"
     
+    # Trust the last result only while the folder is still there (it may have
+    # been deleted or its drive removed since); otherwise re-validate fully
+    if folder_path == _LAST_VALID_FOLDER and os.path.isdir(folder_path):
+        return True, ""
+    _LAST_VALID_FOLDER = None
+    
     # Try to create folder if it doesn't exist
     try:
         os.makedirs(folder_path, exist_ok=True)
     except Exception as e:
+        _LAST_VALID_FOLDER = None
         return False, f"Cannot create folder: {e}"
     
-    # Check if writable
-    if not os.access(folder_path, os.W_OK):
+    # Check if writable by actually creating a file (os.access is
+    # unreliable for directories on Windows)
+    probe_path = os.path.join(folder_path, _WRITE_PROBE_NAME)
+    try:
+        fd = os.open(probe_path, os.O_CREAT | os.O_WRONLY | os.O_EXCL)
+        os.close(fd)
+        os.unlink(probe_path)
+    except FileExistsError:
+        # Leftover probe from an interrupted check - removing it proves
+        # the folder is writable
+        try:
+            os.unlink(probe_path)
+        except OSError:
+            return False, "Folder is not writable. Please choose a different location."
+    except OSError:
         return False, "Folder is not writable. Please choose a different location."
     
+    _LAST_VALID_FOLDER = folder_path
     return True, ""
 
 
@@ -64,9 +95,15 @@ def format_time(seconds):
     if seconds < 0:
         return "Unknown"
     
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=1024)
+def _format_whole_seconds(seconds):
+    """Format a non-negative whole number of seconds (memoized)."""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
     
     if hours > 0:
         return f"{hours}h {minutes}m {secs}s"
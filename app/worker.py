@@ -3,14 +3,65 @@ Background worker thread for running the PDF download process.
 """
 import threading
 import asyncio
+import collections
+import json
 import queue
 import os
 import sys
+import traceback
 from pathlib import Path
 
-# Add parent directory to path to import jdp_scraper
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# uvloop is a faster drop-in event loop (not available on Windows, where the
+# default proactor loop is used)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
+# orjson is optional - much faster than json for large tracking files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional - lets very large tracking files be counted in constant
+# memory instead of building the whole dict
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Read size used when counting inventory.csv rows
+CSV_READ_CHUNK_SIZE = 1024 * 1024
+
+# tracking.json files above this size are streamed with ijson (if installed)
+TRACKING_STREAM_THRESHOLD = 4 * 1024 * 1024
+
+# Browsers shipped next to the executable in distribution packages (resolved
+# once at import; None when running from source or if the folder is missing)
+BUNDLED_BROWSER_PATH = None
+if hasattr(sys, '_MEIPASS'):
+    _browser_path = os.path.join(os.path.dirname(sys.executable), 'ms-playwright')
+    if os.path.isdir(_browser_path):
+        BUNDLED_BROWSER_PATH = _browser_path
+
+# Maximum number of unread progress updates kept for the GUI (oldest are
+# dropped first - the GUI only needs the latest totals)
+PROGRESS_BUFFER_SIZE = 4096
+
+# One progress update published to the GUI (much smaller than a dict)
+ProgressEvent = collections.namedtuple(
+    'ProgressEvent', 'type processed succeeded failed ref status'
+)
+
+# Add parent directory to path to import jdp_scraper (not needed in a frozen
+# bundle, and skipped if it's already there)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if not getattr(sys, 'frozen', False) and _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from jdp_scraper import config
+from jdp_scraper.config import RunConfig
 from jdp_scraper.orchestration_async import run_async
 
 
@@ -22,6 +73,14 @@ class DownloadWorker(threading.Thread):
     back to the GUI via a queue.
     """
     
+    # Own attributes live in slots (Thread itself still has a __dict__)
+    __slots__ = (
+        'username', 'password', 'download_folder', 'max_downloads',
+        'num_workers', 'headless', 'result_queue', 'debug',
+        'progress_updates', 'progress_ready',
+        '_stop_requested', '_cached_total',
+    )
+    
     def __init__(self, username, password, download_folder, max_downloads, num_workers, 
                  headless, result_queue):
         """
@@ -44,7 +103,19 @@ class DownloadWorker(threading.Thread):
         self.num_workers = num_workers
         self.headless = headless
         self.result_queue = result_queue
-        self._stop_event = threading.Event()
+        # Plain flag - nothing ever waits on it, so no Event/lock is needed
+        self._stop_requested = False
+        
+        # Extra debug events for the GUI (set JDP_DEBUG=1)
+        self.debug = os.environ.get("JDP_DEBUG", "").lower() in ("true", "1", "yes")
+        
+        # Total item count, computed once per run
+        self._cached_total = None
+        
+        # Progress channel to the GUI. deque.append is atomic, so the hot path
+        # takes no lock; result_queue is only used for control messages
+        self.progress_updates = collections.deque(maxlen=PROGRESS_BUFFER_SIZE)
+        self.progress_ready = threading.Event()
     
     def run(self):
         """
@@ -53,37 +124,31 @@ class DownloadWorker(threading.Thread):
         This is called automatically when thread.start() is called.
         """
         try:
-            # Set environment variables for the downloader
-            os.environ['JD_USER'] = self.username
-            os.environ['JD_PASS'] = self.password
-            print(f"[WORKER] Set credentials - Username: '{self.username}', Password: {'*' * len(self.password) if self.password else 'EMPTY'}")
-            os.environ['HEADLESS'] = 'true' if self.headless else 'false'
-            os.environ['MAX_DOWNLOADS'] = str(self.max_downloads)
-            os.environ['CONCURRENT_CONTEXTS'] = str(self.num_workers)
-            os.environ['BLOCK_RESOURCES'] = 'true'
-            os.environ['DOWNLOAD_FOLDER'] = self.download_folder
-            print(f"[WORKER] Set DOWNLOAD_FOLDER to: '{self.download_folder}'")
+            # Settings are handed to the downloader directly (not via
+            # os.environ, which would also leak credentials to child processes)
+            run_config = RunConfig(
+                username=self.username,
+                password=self.password,
+                download_folder=self.download_folder,
+                max_downloads=self.max_downloads,
+                num_workers=self.num_workers,
+                headless=self.headless,
+                block_resources=True,
+            )
+            if self.debug:
+                self._send_debug(f"Credentials - Username: '{self.username}', Password: {'<set>' if self.password else 'EMPTY'}")
             
-            # Reset config cache to use the new environment variable
-            from jdp_scraper.config import reset_run_directory_cache
-            reset_run_directory_cache()
-            print(f"[WORKER] Reset config cache to use new DOWNLOAD_FOLDER")
+            # Point the run directory at the chosen folder before anything
+            # (including _get_total_items) resolves it. Each run re-resolves
+            # it, so a second run the same day gets its own "(2)" folder.
+            config.reset_run_directory_cache()
+            config.set_download_folder(self.download_folder)
             
             # Ensure PLAYWRIGHT_BROWSERS_PATH is set for distribution packages
-            if 'PLAYWRIGHT_BROWSERS_PATH' not in os.environ:
-                # Try to find browsers in the same directory as the executable
-                if hasattr(sys, '_MEIPASS'):
-                    # Running from PyInstaller bundle
-                    exe_dir = os.path.dirname(sys.executable)
-                    browser_path = os.path.join(exe_dir, 'ms-playwright')
-                    if os.path.exists(browser_path):
-                        os.environ['PLAYWRIGHT_BROWSERS_PATH'] = browser_path
-                        print(f"[BROWSER] Set PLAYWRIGHT_BROWSERS_PATH to: {browser_path}")
-                    else:
-                        print(f"[WARNING] Browser folder not found at: {browser_path}")
-                else:
-                    # Running from source
-                    print("[INFO] Running from source - using system Playwright browsers")
+            if BUNDLED_BROWSER_PATH and 'PLAYWRIGHT_BROWSERS_PATH' not in os.environ:
+                os.environ['PLAYWRIGHT_BROWSERS_PATH'] = BUNDLED_BROWSER_PATH
+                if self.debug:
+                    self._send_debug(f"Set PLAYWRIGHT_BROWSERS_PATH to: {BUNDLED_BROWSER_PATH}")
             
             # Send start message
             self.result_queue.put({
@@ -92,13 +157,11 @@ class DownloadWorker(threading.Thread):
             })
             
             # Debug: Send environment info
-            self.result_queue.put({
-                'type': 'debug',
-                'message': f'Environment: HEADLESS={os.environ.get("HEADLESS")}, MAX_DOWNLOADS={os.environ.get("MAX_DOWNLOADS")}, WORKERS={os.environ.get("CONCURRENT_CONTEXTS")}, DOWNLOAD_FOLDER={os.environ.get("DOWNLOAD_FOLDER")}'
-            })
+            if self.debug:
+                self._send_debug(f'Environment: HEADLESS={run_config.headless}, MAX_DOWNLOADS={run_config.max_downloads}, WORKERS={run_config.num_workers}, DOWNLOAD_FOLDER={run_config.download_folder}')
             
             # Run the async downloader
-            asyncio.run(self._run_with_progress())
+            self._run_coroutine(self._run_with_progress(run_config))
             
             # Send completion message
             self.result_queue.put({
@@ -113,21 +176,40 @@ class DownloadWorker(threading.Thread):
                 'message': f'Error: {str(e)}'
             })
             
-            import traceback
             traceback.print_exc()
     
-    async def _run_with_progress(self):
+    def _run_coroutine(self, coro):
+        """
+        Run a coroutine to completion on a fresh event loop (uvloop if
+        available), with asyncio debug mode explicitly off.
+        
+        Args:
+            coro: Coroutine to run
+        """
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        
+        if hasattr(asyncio, "Runner"):  # Python 3.11+
+            with asyncio.Runner(debug=False, loop_factory=loop_factory) as runner:
+                return runner.run(coro)
+        
+        # Python 3.10
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return asyncio.run(coro, debug=False)
+    
+    async def _run_with_progress(self, run_config):
         """
         Run the async downloader with progress reporting.
         
         This wraps the main run_async function and sends progress
         updates to the GUI.
-        """
-        # Import here to avoid circular imports
-        from jdp_scraper import checkpoint, metrics
         
-        # Get total count from tracking.json or CSV
-        total_items = self._get_total_items()
+        Args:
+            run_config: RunConfig for this run
+        """
+        # Get total count from tracking.json or CSV (file I/O, so keep it
+        # off the event loop)
+        total_items = await asyncio.to_thread(self._get_total_items)
         
         # Debug: Send total count info
         self.result_queue.put({
@@ -141,74 +223,72 @@ class DownloadWorker(threading.Thread):
             'total_items': total_items
         })
         
-        # Monkey-patch checkpoint to send updates to GUI
-        original_record_success = checkpoint.ProgressCheckpoint.record_success
-        original_record_failure = checkpoint.ProgressCheckpoint.record_failure
-        
-        async def patched_record_success(self_checkpoint, ref):
-            await original_record_success(self_checkpoint, ref)
-            # Send progress update
-            self.result_queue.put({
-                'type': 'progress',
-                'processed': self_checkpoint.total_processed,
-                'succeeded': self_checkpoint.total_succeeded,
-                'failed': self_checkpoint.total_failed,
-                'last_ref': ref,
-                'status': 'success'
-            })
-        
-        async def patched_record_failure(self_checkpoint, ref):
-            await original_record_failure(self_checkpoint, ref)
-            # Send progress update
-            self.result_queue.put({
-                'type': 'progress',
-                'processed': self_checkpoint.total_processed,
-                'succeeded': self_checkpoint.total_succeeded,
-                'failed': self_checkpoint.total_failed,
-                'last_ref': ref,
-                'status': 'failure'
-            })
+        # Run the main async downloader
+        # Note: The async downloader doesn't currently support graceful stopping
+        # For now, it will complete the current task before stopping
+        await run_async(run_config=run_config,
+                        progress_callback=self._queue_progress)
+    
+    def _send_debug(self, message):
+        """Send a debug message to the GUI."""
+        self.result_queue.put({
+            'type': 'debug',
+            'message': message
+        })
+    
+    def _queue_progress(self, progress_checkpoint, ref, status):
+        """
+        Publish a progress update for the GUI.
         
-        # Apply patches
-        checkpoint.ProgressCheckpoint.record_success = patched_record_success
-        checkpoint.ProgressCheckpoint.record_failure = patched_record_failure
+        Updates are appended to progress_updates as ProgressEvent tuples
+        and progress_ready is set. The GUI is woken only when progress_ready
+        was clear, i.e. at most once per drain, however fast results arrive.
         
-        try:
-            # Run the main async downloader
-            # Note: The async downloader doesn't currently support graceful stopping
-            # For now, it will complete the current task before stopping
-            await run_async(self.username, self.password)
-        finally:
-            # Restore original methods
-            checkpoint.ProgressCheckpoint.record_success = original_record_success
-            checkpoint.ProgressCheckpoint.record_failure = original_record_failure
+        Args:
+            progress_checkpoint: Checkpoint holding the running totals
+            ref: Reference number that was just processed
+            status: 'success' or 'failure'
+        """
+        self.progress_updates.append(ProgressEvent(
+            'progress',
+            progress_checkpoint.total_processed,
+            progress_checkpoint.total_succeeded,
+            progress_checkpoint.total_failed,
+            ref,
+            status,
+        ))
+        if not self.progress_ready.is_set():
+            self.progress_ready.set()
+            self.result_queue.notify()
     
     def _get_total_items(self):
         """
         Get total number of items to process from tracking.json or CSV.
         
+        The result is cached for the lifetime of this worker.
+        
         Returns:
             int: Total number of items to process
         """
+        if self._cached_total is None:
+            self._cached_total = self._count_total_items()
+        return self._cached_total
+    
+    def _count_total_items(self):
+        """Count the items to process (uncached, see _get_total_items)."""
         try:
-            # Try to get from tracking.json first
-            from jdp_scraper import config
-            tracking_path = os.path.join(config.DATA_DIR(), "tracking.json")
+            # One directory read tells us which of the files exist
+            with os.scandir(config.DATA_DIR()) as it:
+                entries = {entry.name: entry for entry in it}
             
-            if os.path.exists(tracking_path):
-                import json
-                with open(tracking_path, 'r') as f:
-                    tracking_data = json.load(f)
-                    return len(tracking_data.get('pending', []))
+            # Try to get from tracking.json first
+            if "tracking.json" in entries:
+                entry = entries["tracking.json"]
+                return self._count_pending(entry.path, entry.stat().st_size)
             
             # Fallback: try to read CSV
-            csv_path = os.path.join(config.DATA_DIR(), "inventory.csv")
-            if os.path.exists(csv_path):
-                import csv
-                with open(csv_path, 'r') as f:
-                    reader = csv.reader(f)
-                    next(reader)  # Skip header
-                    return sum(1 for row in reader)
+            if "inventory.csv" in entries:
+                return self._count_csv_rows(entries["inventory.csv"].path)
             
             return 0  # Unknown total
             
@@ -216,6 +296,60 @@ class DownloadWorker(threading.Thread):
             print(f"Warning: Could not determine total items: {e}")
             return 0
     
+    def _count_csv_rows(self, csv_path):
+        """
+        Count data rows in a CSV by counting newlines in the raw bytes.
+        
+        Reads in 1 MiB chunks without decoding or parsing, so memory use is
+        constant regardless of file size.
+        
+        Args:
+            csv_path: Path to the CSV file
+        
+        Returns:
+            int: Number of rows, excluding the header
+        """
+        lines = 0
+        last_chunk = b''
+        with open(csv_path, 'rb', buffering=0) as f:
+            while True:
+                chunk = f.read(CSV_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                last_chunk = chunk
+        
+        if not last_chunk:
+            return 0
+        if not last_chunk.endswith(b'\n'):
+            lines += 1  # Last line has no trailing newline
+        return max(lines - 1, 0)  # Skip header
+    
+    def _count_pending(self, tracking_path, size):
+        """
+        Count pending references in tracking.json.
+        
+        tracking.json maps reference number -> PDF name (None = pending).
+        Large files are streamed with ijson when it is installed.
+        
+        Args:
+            tracking_path: Path to tracking.json
+            size: File size in bytes
+        
+        Returns:
+            int: Number of pending references
+        """
+        with open(tracking_path, 'rb') as f:
+            if ijson is not None and size > TRACKING_STREAM_THRESHOLD:
+                return sum(1 for _, pdf in ijson.kvitems(f, '') if pdf is None)
+            raw = f.read()
+        
+        if orjson is not None:
+            tracking_data = orjson.loads(raw)
+        else:
+            tracking_data = json.loads(raw)
+        return sum(1 for pdf in tracking_data.values() if pdf is None)
+    
     def stop(self):
         """
         Signal the worker to stop.
@@ -223,7 +357,7 @@ class DownloadWorker(threading.Thread):
         Note: This is a graceful stop request. The worker may take
         time to finish current task.
         """
-        self._stop_event.set()
+        self._stop_requested = True
         self.result_queue.put({
             'type': 'stop_requested',
             'message': 'Stop requested, finishing current task...'
@@ -231,5 +365,5 @@ class DownloadWorker(threading.Thread):
     
     def is_stopped(self):
         """Check if stop has been requested."""
-        return self._stop_event.is_set()
+        return self._stop_requested
 
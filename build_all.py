@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Build the clean, debug and minimal executables in parallel, then assemble
+their distribution packages.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import build_clean_executable
+import build_debug_executable
+import build_minimal_executable
+from build_common import build_is_current, run_build_job, worker_count, write_fingerprint
+
+def build_executables():
+    """Run every PyInstaller build concurrently.
+    
+    Each job already runs in its own pyinstaller process, so threads are
+    enough to drive them; every job gets its own config dir and workpath.
+    
+    Returns:
+        True if every build succeeded
+    """
+    jobs = []
+    for job in (
+        build_clean_executable.pyinstaller_job(),
+        build_debug_executable.pyinstaller_job(),
+        build_minimal_executable.pyinstaller_job(),
+    ):
+        if build_is_current(job):
+            print(f"[OK] {job.name}.exe is up to date (cache hit)")
+        else:
+            jobs.append(job)
+    if not jobs:
+        return True
+    
+    ok = True
+    with ThreadPoolExecutor(max_workers=min(len(jobs), worker_count())) as pool:
+        futures = [pool.submit(run_build_job, job) for job in jobs]
+        for future in as_completed(futures):
+            job, returncode = future.result()
+            if returncode == 0:
+                write_fingerprint(job)
+                print(f"[OK] Built {job.name}.exe")
+            else:
+                print(f"[ERROR] {job.name} failed with exit code {returncode} (see build_{job.name}.log)")
+                ok = False
+    return ok
+
+def main():
+    print("=== JDPowerDownloader Parallel Build ===")
+    
+    if not build_executables():
+        print("Build failed!")
+        return False
+    
+    # The minimal package is cloned from the clean one, so keep this order
+    if build_clean_executable.create_clean_distribution() is False:
+        return False
+    if not build_debug_executable.package_debug_distribution():
+        return False
+    if build_minimal_executable.create_minimal_distribution() is False:
+        return False
+    
+    print("\nAll builds completed successfully!")
+    return True
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -12,9 +12,14 @@ Usage:
 """
 import os
 import shutil
+import subprocess
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from build_common import link_or_copy, worker_count
+
 # Colors for terminal output (Windows compatible)
 class Colors:
     HEADER = '\033[95m'
@@ -90,6 +95,14 @@ def clean_build_dir():
     print_success("Build directory cleaned")
 
 
+def copy_files_parallel(file_pairs, max_workers=None):
+    """Copy (src, dst) pairs concurrently using link_or_copy."""
+    if max_workers is None:
+        max_workers = worker_count()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda pair: link_or_copy(*pair), file_pairs))
+
+
 def create_build_structure():
     """Create clean build directory with only essential files."""
     print_header("Step 2: Creating Clean Build Structure")
@@ -102,41 +115,49 @@ def create_build_structure():
     src_dir = build_dir / 'jdp_scraper'
     src_dir.mkdir(exist_ok=True)
     
-    copied_count = 0
+    # Collect everything first, then copy in one parallel batch
+    file_pairs = []
     for file in ESSENTIAL_FILES['jdp_scraper']:
         src = Path('jdp_scraper') / file
         dst = src_dir / file
         if src.exists():
-            shutil.copy2(src, dst)
-            copied_count += 1
+            file_pairs.append((src, dst))
         else:
             print_warning(f"File not found: {src}")
+    scraper_count = len(file_pairs)
+    
+    root_files = []
+    for file in ESSENTIAL_FILES['root']:
+        src = Path(file)
+        if src.exists():
+            file_pairs.append((src, build_dir / file))
+            root_files.append(file)
+        else:
+            print_warning(f"File not found: {file}")
+    
+    # GUI entry point (if exists)
+    has_main_gui = os.path.exists('main_gui.py')
+    if has_main_gui:
+        file_pairs.append((Path('main_gui.py'), build_dir / 'main_gui.py'))
     
-    print_success(f"Copied {copied_count} jdp_scraper files")
+    copy_files_parallel(file_pairs)
+    print_success(f"Copied {scraper_count} jdp_scraper files")
     
     # Copy app files (if they exist)
     if os.path.exists('app'):
         print_info("Copying app/ GUI files...")
         app_dst = build_dir / 'app'
-        shutil.copytree('app', app_dst, dirs_exist_ok=True)
+        shutil.copytree('app', app_dst, dirs_exist_ok=True, copy_function=link_or_copy)
         print_success("Copied app/ directory")
     else:
         print_warning("app/ directory not found (will be created during GUI development)")
     
-    # Copy root files
+    # Root files
     print_info("Copying root files...")
-    for file in ESSENTIAL_FILES['root']:
-        src = Path(file)
-        dst = build_dir / file
-        if src.exists():
-            shutil.copy2(src, dst)
-            print_success(f"Copied {file}")
-        else:
-            print_warning(f"File not found: {file}")
+    for file in root_files:
+        print_success(f"Copied {file}")
     
-    # Copy GUI entry point (if exists)
-    if os.path.exists('main_gui.py'):
-        shutil.copy2('main_gui.py', build_dir / 'main_gui.py')
+    if has_main_gui:
         print_success("Copied main_gui.py")
     else:
         print_warning("main_gui.py not found (will be created during GUI development)")
@@ -272,8 +293,6 @@ def run_pyinstaller(spec_path):
         return False
     
     # Run PyInstaller
-    import subprocess
-    
     result = subprocess.run(
         ['pyinstaller', str(spec_path), '--clean'],
         capture_output=True,
@@ -357,7 +376,6 @@ def main():
         
     except Exception as e:
         print_error(f"Build failed with error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -6,62 +6,48 @@ This will be the user-friendly version for end users.
 
 import os
 import sys
-import shutil
-import subprocess
 from pathlib import Path
 
-def safe_rmtree(path):
-    """Safely remove directory tree, handling permission errors."""
-    if os.path.exists(path):
-        try:
-            shutil.rmtree(path)
-        except PermissionError:
-            print("You may need to close any running instances of the app")
+from build_common import (
+    BuildJob,
+    build_is_current,
+    fast_copytree,
+    link_or_copy,
+    make_pyinstaller_cmd,
+    remove_job_output,
+    run_pyinstaller,
+    safe_rmtree,
+    write_fingerprint,
+)
+
+def pyinstaller_job():
+    """Describe the PyInstaller build for this variant (windowed, no console)."""
+    cmd = make_pyinstaller_cmd('JDPowerDownloader_Clean', windowed=True)
+    return BuildJob('JDPowerDownloader_Clean', cmd, os.path.join('build', 'JDPowerDownloader_Clean'), 'dist')
 
 def build_clean_executable():
     """Build a clean production version without console output."""
     print("Building clean JDPowerDownloader.exe...")
     
-    # Clean previous builds
-    safe_rmtree('build')
-    safe_rmtree('dist')
+    job = pyinstaller_job()
+    if build_is_current(job):
+        print("Sources unchanged since last build (cache hit), skipping PyInstaller")
+        return True
+    
+    # Clean this variant's previous build (other variants stay cached)
+    remove_job_output(job)
     
-    # Build PyInstaller command (WITH --windowed to hide console)
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        '--windowed',  # This hides the console window
-        '--name=JDPowerDownloader_Clean',
-        '--add-data=jdp_scraper;jdp_scraper',
-        '--add-data=app;app',
-        '--collect-all=playwright',
-        '--hidden-import=playwright',
-        '--hidden-import=playwright.async_api',
-        '--hidden-import=asyncio',
-        '--hidden-import=queue',
-        '--hidden-import=threading',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.ttk',
-        '--exclude-module=test_*',
-        '--exclude-module=validate_*',
-        '--exclude-module=tkinter.test',
-        '--exclude-module=unittest',
-        '--exclude-module=pydoc',
-        'main_gui.py'
-    ]
+    cmd = job.cmd
     
     print("Running PyInstaller...")
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("PyInstaller completed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"PyInstaller failed with exit code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+    log_path = f'build_{job.name}.log'
+    returncode = run_pyinstaller(cmd, log_path)
+    if returncode != 0:
+        print(f"PyInstaller failed with exit code {returncode} (full output in {log_path})")
         return False
+    print("PyInstaller completed successfully!")
+    write_fingerprint(job)
+    return True
 
 def create_clean_distribution():
     """Create a clean distribution package."""
@@ -78,7 +64,7 @@ def create_clean_distribution():
     exe_dest = dist_dir / 'JDPowerDownloader.exe'
     
     if exe_source.exists():
-        shutil.copy2(exe_source, exe_dest)
+        link_or_copy(exe_source, exe_dest)
         print(f"[OK] Copied clean executable: {exe_dest}")
     else:
         print(f"[ERROR] Executable not found: {exe_source}")
@@ -89,7 +75,7 @@ def create_clean_distribution():
     playwright_dest = dist_dir / 'ms-playwright'
     
     if playwright_source.exists():
-        shutil.copytree(playwright_source, playwright_dest)
+        fast_copytree(playwright_source, playwright_dest)
         print(f"[OK] Copied Playwright browsers")
     else:
         print(f"[ERROR] Playwright browsers not found: {playwright_source}")
@@ -127,8 +113,7 @@ TROUBLESHOOTING:
 For support, contact the developer.
 '''
     
-    with open(dist_dir / 'README.txt', 'w') as f:
-        f.write(readme_content)
+    (dist_dir / 'README.txt').write_text(readme_content, encoding='utf-8', newline='\r\n')
     print("[OK] Created clean README")
     
     print(f"\n[SUCCESS] Clean distribution package created!")
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the PyInstaller build and packaging scripts.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+# A single PyInstaller invocation: exe name, command line, and the
+# work/dist directories it should use when run alongside other builds
+BuildJob = namedtuple('BuildJob', 'name cmd workpath distpath')
+
+# PyInstaller options shared by every build variant
+BASE_ADD_DATA = (
+    'jdp_scraper;jdp_scraper',
+    'app;app',
+)
+# Collect only what the app uses instead of --collect-all=playwright,
+# which rescans and reclassifies every file in the package
+BASE_COLLECT = (
+    ('submodules', 'playwright.async_api'),
+    ('data', 'playwright'),
+    ('binaries', 'playwright'),
+    # Replaces listing tkinter, tkinter.messagebox/filedialog/ttk as
+    # hidden imports; --exclude-module=tkinter.test still applies
+    ('submodules', 'tkinter'),
+)
+BASE_HIDDEN_IMPORTS = (
+    'playwright',
+    'playwright.async_api',
+    'asyncio',
+    'queue',
+    'threading',
+)
+BASE_EXCLUDES = (
+    'test_*',
+    'validate_*',
+    'tkinter.test',
+    'unittest',
+    'pydoc',
+    # Nothing in app/ or jdp_scraper/ uses these; keep PyInstaller from
+    # following them in transitively from whatever is installed
+    'test',
+    'doctest',
+    'pydoc_data',
+    'lib2to3',
+    'distutils',
+    'setuptools',
+    'xmlrpc',
+    'http.server',
+    'curses',
+    'numpy',
+    'pandas',
+    'scipy',
+    'matplotlib',
+    'PIL',
+)
+
+# PyInstaller work directory shared by the serial build scripts. Keeping it
+# between runs lets PyInstaller reuse its analysis of unchanged modules and
+# binaries instead of rescanning Playwright every time.
+BUILD_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.build-cache')
+
+# Bytecode optimization level for the frozen app (needs PyInstaller 6.6+).
+# 2 drops asserts and docstrings from every bundled module, third-party
+# packages such as Playwright included, not just app/ and jdp_scraper/
+OPTIMIZE_LEVEL = 2
+
+# Binaries UPX must leave alone: signed runtime DLLs and Chromium's own
+UPX_EXCLUDES = ('vcruntime140.dll', 'chrome.dll')
+
+# Sets PLAYWRIGHT_BROWSERS_PATH inside the frozen app (replaces the .bat launcher)
+RUNTIME_HOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runtime_hook.py')
+
+# Sources that end up inside the executable
+BUILD_INPUTS = ('main_gui.py', 'runtime_hook.py', 'jdp_scraper', 'app')
+HASH_CHUNK_SIZE = 1 << 20
+# Unlinking is bound by filesystem metadata updates, not CPU
+RMTREE_WORKERS = 16
+COPY_CHUNK_SIZE = 1 << 20
+
+# Larger copy buffer for the big Chromium binaries; shutil defaults to
+# 64 KiB on Windows, where it matters most (Linux uses sendfile anyway)
+if hasattr(shutil, 'COPY_BUFSIZE'):
+    shutil.COPY_BUFSIZE = (1 << 20) if os.name == 'nt' else (256 << 10)
+
+def make_pyinstaller_cmd(name, *, windowed, onefile=True, extra_data=(), extra_hidden=()):
+    """Build the PyInstaller command line for one executable variant.
+    
+    --onefile gives a single exe but unpacks itself to a temp dir on every
+    launch; --onedir starts faster at the cost of shipping a folder.
+    Symbols are stripped where a strip tool exists (PyInstaller advises
+    against it on Windows) and UPX is used when it is on PATH.
+    
+    Args:
+        name: Executable name (without .exe)
+        windowed: True to hide the console window
+        onefile: False to build a --onedir folder instead of a single exe
+        extra_data: Additional 'src;dest' --add-data entries
+        extra_hidden: Additional --hidden-import modules
+    
+    Returns:
+        Command list starting with 'pyinstaller'
+    """
+    # --noconfirm: a rebuilt --onedir folder replaces the old one without a
+    # prompt (output goes to a log, so nobody could answer it)
+    cmd = ['pyinstaller', '--noconfirm', '--onefile' if onefile else '--onedir']
+    if windowed:
+        cmd.append('--windowed')
+    if os.name != 'nt' and shutil.which('strip'):
+        cmd.append('--strip')
+    upx = shutil.which('upx')
+    if upx:
+        cmd.append(f'--upx-dir={os.path.dirname(upx)}')
+        cmd += [f'--upx-exclude={dll}' for dll in UPX_EXCLUDES]
+    cmd.append(f'--optimize={OPTIMIZE_LEVEL}')
+    cmd.append(f'--name={name}')
+    cmd.append(f'--workpath={BUILD_CACHE_DIR}')
+    cmd.append(f'--runtime-hook={RUNTIME_HOOK}')
+    cmd += [f'--add-data={data}' for data in (*BASE_ADD_DATA, *extra_data)]
+    cmd += [f'--collect-{kind}={package}' for kind, package in BASE_COLLECT]
+    cmd += [f'--hidden-import={module}' for module in (*BASE_HIDDEN_IMPORTS, *extra_hidden)]
+    cmd += [f'--exclude-module={module}' for module in BASE_EXCLUDES]
+    cmd.append('main_gui.py')
+    return cmd
+
+@lru_cache(maxsize=None)
+def worker_count():
+    """Number of parallel workers for copies, compiles and builds.
+    
+    Defaults to the CPU count; set JDP_BUILD_WORKERS to override it.
+    """
+    cpus = os.cpu_count() or 4
+    try:
+        workers = max(1, int(os.environ.get('JDP_BUILD_WORKERS') or cpus))
+    except ValueError:
+        print(f"Warning: ignoring invalid JDP_BUILD_WORKERS={os.environ['JDP_BUILD_WORKERS']!r}")
+        workers = cpus
+    print(f"Detected CPU count: {cpus}, configured worker count: {workers}")
+    return workers
+
+@lru_cache(maxsize=None)
+def playwright_browsers_dir():
+    """Get the path to the locally installed Playwright browsers.
+    
+    The lookup is resolved once per process; call sites that only need to
+    know whether the browsers are installed should use
+    playwright_browsers_installed() instead of statting the path again.
+    """
+    if os.name == 'nt':  # Windows
+        return Path(os.environ.get('LOCALAPPDATA', '')) / 'ms-playwright'
+    else:  # Unix-like
+        return Path.home() / '.local' / 'share' / 'ms-playwright'
+
+@lru_cache(maxsize=None)
+def playwright_browsers_installed():
+    """Return True if the Playwright browsers directory exists."""
+    return playwright_browsers_dir().is_dir()
+
+def _force_unlink(path):
+    """Unlink a file, clearing the read-only bit first if Windows insists."""
+    try:
+        os.unlink(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        os.unlink(path)
+
+def _collect_file_paths(path, files):
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _collect_file_paths(entry.path, files)
+            else:
+                files.append(entry.path)
+
+def safe_rmtree(path):
+    """Safely remove directory tree, handling permission errors.
+    
+    Files are unlinked in parallel first (deleting is metadata I/O bound,
+    so the threads overlap the latency), then shutil.rmtree removes the
+    emptied directories and retries anything left over. Read-only files,
+    common in Chromium's tree, are made writable and retried. A missing
+    path is not an error, and a symlink is never followed - rmtree refuses
+    it rather than the pre-pass emptying the directory it points to.
+    """
+    denied = False
+    
+    def _onexc(func, failed_path, exc):
+        nonlocal denied
+        if isinstance(exc, FileNotFoundError):
+            return
+        if isinstance(exc, PermissionError) and func in (os.unlink, os.remove, os.rmdir):
+            try:
+                os.chmod(failed_path, stat.S_IWRITE)
+                func(failed_path)
+                return
+            except OSError as retry_exc:
+                exc = retry_exc
+        print(f"Warning: Could not remove {failed_path} ({exc})")
+        if isinstance(exc, PermissionError):
+            denied = True
+    
+    files = []
+    if not os.path.islink(path):
+        try:
+            _collect_file_paths(path, files)
+        except OSError:
+            pass  # Missing or not a directory; rmtree reports anything real
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=RMTREE_WORKERS) as pool:
+            for future in [pool.submit(_force_unlink, f) for f in files]:
+                try:
+                    future.result()
+                except OSError:
+                    pass  # Retried and reported by rmtree below
+    
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_onexc)
+    else:
+        shutil.rmtree(path, onerror=lambda func, p, exc_info: _onexc(func, p, exc_info[1]))
+    if denied:
+        print("You may need to close any running instances of the app")
+
+def _copy_entry(entry, dst_path):
+    """Copy one file, reusing the stat result cached on the DirEntry."""
+    if entry.is_symlink():
+        os.symlink(os.readlink(entry.path), dst_path)
+        return
+    st = entry.stat(follow_symlinks=False)
+    shutil.copyfile(entry.path, dst_path)
+    os.chmod(dst_path, st.st_mode)
+    os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def _collect_files(src, dst, pairs):
+    """Create the directory skeleton under dst and collect file copy jobs."""
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_path = dst / entry.name
+            if entry.is_dir(follow_symlinks=False):
+                _collect_files(entry.path, dst_path, pairs)
+            else:
+                pairs.append((entry, dst_path))
+
+def fast_copytree(src, dst, workers=None):
+    """Copy a directory tree using a thread pool for the per-file copies.
+    
+    The tree is walked once with os.scandir so each file is only statted
+    through its cached DirEntry, then the copies run concurrently. This is
+    much faster than shutil.copytree for trees of many small files such as
+    ms-playwright.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+        workers: Number of copy threads (default: worker_count())
+    
+    Returns:
+        Number of files copied
+    """
+    pairs = []
+    _collect_files(src, Path(dst), pairs)
+    if workers is None:
+        workers = worker_count()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pairs)))) as pool:
+        futures = [pool.submit(_copy_entry, entry, dst_path) for entry, dst_path in pairs]
+        for future in as_completed(futures):
+            future.result()
+    return len(pairs)
+
+def copy_and_size(src, dst):
+    """Copy a file with its metadata and return the number of bytes copied.
+    
+    Uses os.sendfile where the platform supports it for file-to-file copies,
+    otherwise a 1 MiB buffered copy, so the size comes from the copy itself
+    rather than a stat() afterwards.
+    """
+    copied = 0
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if hasattr(os, 'sendfile') and os.name != 'nt':
+            try:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                while sent := os.sendfile(out_fd, in_fd, copied, COPY_CHUNK_SIZE * 8):
+                    copied += sent
+            except OSError:
+                if copied:
+                    raise
+        if not copied:
+            while chunk := fsrc.read(COPY_CHUNK_SIZE):
+                fdst.write(chunk)
+                copied += len(chunk)
+    shutil.copystat(src, dst)
+    return copied
+
+def link_or_copy(src, dst):
+    """
+    Hardlink src to dst (metadata-only, no bytes copied), falling back to
+    a regular copy across filesystems or where links aren't supported.
+    """
+    try:
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        copy_and_size(src, dst)
+    return dst
+
+def _link_or_copy_entry(entry, dst_path):
+    """Hardlink one file, copying it (with mode bits and mtime) if linking fails."""
+    try:
+        os.link(entry.path, dst_path)
+    except OSError:
+        shutil.copy2(entry.path, dst_path, follow_symlinks=False)
+
+def fast_clone(src, dst, workers=None):
+    """Clone a directory tree with hardlinks, in parallel, measuring as it goes.
+    
+    Files are hardlinked (no data copied) where the filesystem allows it and
+    copied otherwise. The byte count comes from the DirEntry stats gathered
+    while walking, so callers don't need a second traversal to report size.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+        workers: Number of threads (default: worker_count())
+    
+    Returns:
+        (file_count, total_bytes) tuple
+    """
+    pairs = []
+    _collect_files(src, Path(dst), pairs)
+    total = sum(entry.stat(follow_symlinks=False).st_size for entry, _ in pairs)
+    if workers is None:
+        workers = worker_count()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pairs)))) as pool:
+        futures = [pool.submit(_link_or_copy_entry, entry, dst_path) for entry, dst_path in pairs]
+        for future in as_completed(futures):
+            future.result()
+    return len(pairs), total
+
+# ms-playwright entries the app needs: Chromium (plus the headless shell
+# newer Playwright uses for headless runs) and the small winldd helper.
+# firefox-*, webkit-* and ffmpeg-* are never used.
+BROWSER_DIR_PATTERN = re.compile(r'^(chromium[-_]|winldd-)')
+
+@lru_cache(maxsize=None)
+def find_browser_dir(browsers_dir, prefix='chromium-'):
+    """Find the newest <prefix><revision> directory in an ms-playwright folder.
+    
+    Avoids hard-coding a revision such as chromium-1187, which changes with
+    every Playwright release. The result is cached per folder.
+    
+    Args:
+        browsers_dir: ms-playwright directory
+        prefix: Directory name prefix, e.g. 'chromium-' or 'winldd-'
+    
+    Returns:
+        Path of the highest revision, or None if there is none
+    """
+    revisions = []
+    for path in Path(browsers_dir).glob(f'{prefix}*'):
+        revision = path.name[len(prefix):]
+        if revision.isdigit() and path.is_dir():
+            revisions.append((int(revision), path))
+    return max(revisions)[1] if revisions else None
+
+def clone_browsers(src, dst):
+    """Clone only the browser directories the app uses out of ms-playwright.
+    
+    Args:
+        src: Installed ms-playwright directory
+        dst: Destination ms-playwright directory
+    
+    Returns:
+        (file_count, total_bytes) tuple
+    """
+    Path(dst).mkdir(parents=True, exist_ok=True)
+    files = total = 0
+    with os.scandir(src) as it:
+        entries = [entry for entry in it
+                   if entry.is_dir() and BROWSER_DIR_PATTERN.match(entry.name)]
+    for entry in entries:
+        count, size = fast_clone(entry.path, Path(dst) / entry.name)
+        files += count
+        total += size
+    return files, total
+
+def walk_collect(root, _prefix=''):
+    """Yield (relative_path, size) for every file under root.
+    
+    One os.scandir pass with cached DirEntry stats, so a caller can get
+    both the total size and a file listing without walking twice.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            rel_path = os.path.join(_prefix, entry.name) if _prefix else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_collect(entry.path, rel_path)
+            elif entry.is_file(follow_symlinks=False):
+                yield rel_path, entry.stat(follow_symlinks=False).st_size
+
+# Already-compressed formats are stored as-is rather than deflated again
+ZIP_STORED_SUFFIXES = frozenset(('.pak', '.br', '.woff2', '.zip', '.gz', '.png', '.jpg'))
+
+def zip_tree(src_dir, zip_path):
+    """Pack a directory into a zip using fast (level 1) deflate compression.
+    
+    One sequential archive is much quicker to hand over than thousands of
+    small files. Files that are already compressed are stored, not
+    deflated, to save CPU.
+    
+    Args:
+        src_dir: Directory to pack (paths in the zip are relative to it)
+        zip_path: Zip file to create
+    
+    Returns:
+        Size of the zip file in bytes
+    """
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for rel_path, _ in sorted(walk_collect(src_dir)):
+            if os.path.splitext(rel_path)[1].lower() in ZIP_STORED_SUFFIXES:
+                zf.write(os.path.join(src_dir, rel_path), rel_path, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(os.path.join(src_dir, rel_path), rel_path)
+    return os.path.getsize(zip_path)
+
+def run_build_job(job):
+    """Run a PyInstaller job in isolation so it can run alongside others.
+    
+    Each job gets its own PYINSTALLER_CONFIG_DIR and work directory so
+    concurrent builds never share PyInstaller's cache. Output goes to
+    build_<name>.log instead of being held in memory.
+    
+    Args:
+        job: BuildJob to run
+    
+    Returns:
+        (job, returncode) tuple
+    """
+    env = os.environ.copy()
+    config_dir = tempfile.mkdtemp(prefix=f'pyinstaller_{job.name}_')
+    env['PYINSTALLER_CONFIG_DIR'] = config_dir
+    # Distribution packages may hardlink the previous exe; unlink it so
+    # PyInstaller writes a new file instead of rewriting the shared one
+    remove_job_output(job)
+    
+    # Parallel jobs must not share the serial builds' work directory
+    cmd = [arg for arg in job.cmd if not arg.startswith('--workpath=')]
+    cmd[1:1] = [f'--workpath={job.workpath}', f'--distpath={job.distpath}']
+    try:
+        with open(f'build_{job.name}.log', 'w', encoding='utf-8') as log:
+            returncode = subprocess.call(cmd, stdout=log, stderr=subprocess.STDOUT, env=env)
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+    return job, returncode
+
+def _hash_tree(digest, path):
+    """Feed a file, or every file under a directory, into digest."""
+    if os.path.isfile(path):
+        digest.update(path.replace(os.sep, '/').encode())
+        with open(path, 'rb') as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.name == '__pycache__':
+            continue
+        _hash_tree(digest, entry.path)
+
+def inputs_hash(cmd):
+    """Hash the build inputs and PyInstaller command line.
+    
+    Args:
+        cmd: PyInstaller command list
+    
+    Returns:
+        Hex digest that changes whenever a source file or the command does
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\0'.join(cmd).encode())
+    for path in BUILD_INPUTS:
+        if os.path.exists(path):
+            _hash_tree(digest, path)
+    return digest.hexdigest()
+
+def _fingerprint_path(job):
+    return Path(job.distpath) / f'.build_fingerprint_{job.name}'
+
+def built_exe_path(job):
+    """Return where PyInstaller puts the job's exe (--onefile or --onedir)."""
+    if '--onedir' in job.cmd:
+        return Path(job.distpath) / job.name / f'{job.name}.exe'
+    return Path(job.distpath) / f'{job.name}.exe'
+
+def build_is_current(job):
+    """Return True if the job's exe exists and was built from the current inputs."""
+    if not built_exe_path(job).exists():
+        return False
+    try:
+        return _fingerprint_path(job).read_text() == inputs_hash(job.cmd)
+    except OSError:
+        return False
+
+def write_fingerprint(job):
+    """Record the inputs hash after a successful build."""
+    path = _fingerprint_path(job)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(inputs_hash(job.cmd))
+
+def remove_job_output(job):
+    """Delete the job's previous exe (or onedir folder) and fingerprint.
+    
+    Other variants built into the same dist folder are left alone, so
+    their fingerprints and exes stay valid for the next build.
+    """
+    exe_path = built_exe_path(job)
+    if '--onedir' in job.cmd:
+        if exe_path.parent.exists():
+            safe_rmtree(exe_path.parent)
+    elif exe_path.exists():
+        # Unlink rather than rewrite: packages may hardlink the old exe
+        exe_path.unlink()
+    _fingerprint_path(job).unlink(missing_ok=True)
+
+def run_streamed(cmd, log_path):
+    """Run a command, echoing its output live and saving it to a log file.
+    
+    Output is streamed line by line instead of being buffered in memory
+    with capture_output=True.
+    
+    Args:
+        cmd: Command list
+        log_path: File that receives a copy of the combined stdout/stderr
+    
+    Returns:
+        The command's exit code
+    """
+    with open(log_path, 'w', encoding='utf-8') as log:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            log.write(line)
+        return proc.wait()
+
+def run_pyinstaller(cmd, log_path):
+    """Run PyInstaller in this process, falling back to a subprocess.
+    
+    Calling PyInstaller.__main__.run directly avoids starting a second
+    interpreter and re-importing PyInstaller. PyInstaller keeps global
+    state, so this is meant for one build per process; build_all keeps
+    using separate processes for its parallel jobs.
+    
+    Args:
+        cmd: PyInstaller command list (cmd[0] is the 'pyinstaller' program)
+        log_path: File that receives a copy of PyInstaller's log output
+    
+    Returns:
+        PyInstaller's exit code
+    """
+    try:
+        import PyInstaller.__main__
+    except ImportError:
+        return run_streamed(cmd, log_path)
+    
+    # PyInstaller reports through logging; mirror it into the log file
+    handler = logging.FileHandler(log_path, mode='w', encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(relativeCreated)d %(levelname)s: %(message)s'))
+    logger = logging.getLogger('PyInstaller')
+    logger.addHandler(handler)
+    try:
+        PyInstaller.__main__.run(cmd[1:])
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        logger.error(f"PyInstaller raised {e!r}")
+        return 1
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
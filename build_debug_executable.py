@@ -6,63 +6,52 @@ This will help us see what's happening when the app runs.
 
 import os
 import sys
-import shutil
-import subprocess
 from pathlib import Path
 
-def safe_rmtree(path):
-    """Safely remove directory tree, handling permission errors."""
-    if os.path.exists(path):
-        try:
-            shutil.rmtree(path)
-        except PermissionError:
-            print(f"Warning: Could not remove {path} (permission denied)")
-            print("You may need to close any running instances of the app")
+from build_common import (
+    BuildJob,
+    build_is_current,
+    clone_browsers,
+    link_or_copy,
+    make_pyinstaller_cmd,
+    playwright_browsers_dir,
+    playwright_browsers_installed,
+    remove_job_output,
+    run_pyinstaller,
+    safe_rmtree,
+    write_fingerprint,
+)
+from launchers import DEBUG_LAUNCHER, write_launcher
+
+def pyinstaller_job():
+    """Describe the PyInstaller build for this variant (console kept for output)."""
+    # Console kept visible so debug output can be seen
+    cmd = make_pyinstaller_cmd('JDPowerDownloader_Debug', windowed=False)
+    return BuildJob('JDPowerDownloader_Debug', cmd, os.path.join('build', 'JDPowerDownloader_Debug'), 'dist')
 
 def build_debug_executable():
     """Build a debug version of the executable with console output."""
     print("Building debug JDPowerDownloader.exe...")
     
-    # Clean previous builds
-    safe_rmtree('build')
-    safe_rmtree('dist')
-    
-    # Build PyInstaller command (WITHOUT --windowed for console output)
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        # '--windowed',  # Commented out to see console output
-        '--name=JDPowerDownloader_Debug',
-        '--add-data=jdp_scraper;jdp_scraper',
-        '--add-data=app;app',
-        '--collect-all=playwright',
-        '--hidden-import=playwright',
-        '--hidden-import=playwright.async_api',
-        '--hidden-import=asyncio',
-        '--hidden-import=queue',
-        '--hidden-import=threading',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.ttk',
-        '--exclude-module=test_*',
-        '--exclude-module=validate_*',
-        '--exclude-module=tkinter.test',
-        '--exclude-module=unittest',
-        '--exclude-module=pydoc',
-        'main_gui.py'
-    ]
+    job = pyinstaller_job()
+    if build_is_current(job):
+        print("Sources unchanged since last build (cache hit), skipping PyInstaller")
+        return True
+    
+    # Clean this variant's previous build (other variants stay cached)
+    remove_job_output(job)
+    
+    cmd = job.cmd
     
     print("Running PyInstaller...")
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("PyInstaller completed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"PyInstaller failed with exit code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+    log_path = f'build_{job.name}.log'
+    returncode = run_pyinstaller(cmd, log_path)
+    if returncode != 0:
+        print(f"PyInstaller failed with exit code {returncode} (full output in {log_path})")
         return False
+    print("PyInstaller completed successfully!")
+    write_fingerprint(job)
+    return True
 
 def create_debug_distribution():
     """Create a debug distribution package."""
@@ -72,6 +61,10 @@ def create_debug_distribution():
     if not build_debug_executable():
         return False
     
+    return package_debug_distribution()
+
+def package_debug_distribution():
+    """Assemble the debug distribution from an already built executable."""
     # Check if executable was created
     exe_path = Path('dist/JDPowerDownloader_Debug.exe')
     if not exe_path.exists():
@@ -79,8 +72,8 @@ def create_debug_distribution():
         return False
     
     # Get Playwright browser path
-    browser_path = os.path.join(os.environ.get('LOCALAPPDATA', ''), 'ms-playwright')
-    if not os.path.exists(browser_path):
+    browser_path = playwright_browsers_dir()
+    if not playwright_browsers_installed():
         print(f"ERROR: Playwright browsers not found at {browser_path}")
         return False
     
@@ -92,52 +85,16 @@ def create_debug_distribution():
     dist_dir.mkdir()
     
     # Copy debug executable
-    shutil.copy2(exe_path, dist_dir / 'JDPowerDownloader_Debug.exe')
+    link_or_copy(exe_path, dist_dir / 'JDPowerDownloader_Debug.exe')
     print(f"[OK] Copied debug executable")
     
     # Copy browsers
     browsers_dest = dist_dir / 'ms-playwright'
-    shutil.copytree(browser_path, browsers_dest)
+    clone_browsers(browser_path, browsers_dest)
     print(f"[OK] Copied Playwright browsers")
     
     # Create debug launcher script
-    launcher_content = '''@echo off
-REM JDPowerDownloader Debug Launcher
-REM This script sets up the environment and launches the debug version
-
-echo Starting JDPowerDownloader Debug Version...
-echo This version will show console output to help debug issues.
-
-REM Get the directory where this script is located
-set SCRIPT_DIR=%~dp0
-
-REM Set Playwright browser path to the ms-playwright folder in the same directory
-set PLAYWRIGHT_BROWSERS_PATH=%SCRIPT_DIR%ms-playwright
-
-echo Browser path set to: %PLAYWRIGHT_BROWSERS_PATH%
-
-REM Verify the browser path exists
-if not exist "%PLAYWRIGHT_BROWSERS_PATH%" (
-    echo ERROR: Browser folder not found at: %PLAYWRIGHT_BROWSERS_PATH%
-    pause
-    exit /b 1
-)
-
-echo Browser folder found. Launching debug application...
-echo.
-echo NOTE: You will see console output that will help identify any issues.
-echo.
-
-REM Launch the debug application
-"%SCRIPT_DIR%JDPowerDownloader_Debug.exe"
-
-echo.
-echo Debug application has closed.
-pause
-'''
-    
-    with open(dist_dir / 'Launch_Debug.bat', 'w') as f:
-        f.write(launcher_content)
+    write_launcher(dist_dir / 'Launch_Debug.bat', DEBUG_LAUNCHER, exe_name='JDPowerDownloader_Debug.exe')
     print("[OK] Created debug launcher script")
     
     # Create README
@@ -156,8 +113,7 @@ without processing any downloads.
 For support, share the console output with the developer.
 '''
     
-    with open(dist_dir / 'README_Debug.txt', 'w') as f:
-        f.write(readme_content)
+    (dist_dir / 'README_Debug.txt').write_text(readme_content, encoding='utf-8', newline='\r\n')
     print("[OK] Created debug README")
     
     print(f"\n[SUCCESS] Debug distribution package created!")
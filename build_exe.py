@@ -3,16 +3,15 @@ Simple build script to create executable without user interaction.
 """
 import os
 import sys
-import subprocess
 import shutil
 from pathlib import Path
 
+from build_common import make_pyinstaller_cmd, run_pyinstaller
+
 def main():
     print("Building JDPowerDownloader.exe...")
     
     # Clean previous builds
-    if os.path.exists('build'):
-        shutil.rmtree('build')
     if os.path.exists('dist'):
         shutil.rmtree('dist')
     
@@ -42,33 +41,17 @@ def main():
     try:
         # Run PyInstaller
         print("Running PyInstaller...")
-        cmd = [
-            'pyinstaller',
-            '--onefile',
-            '--windowed',
-            '--name=JDPowerDownloader',
-            '--add-data=jdp_scraper;jdp_scraper',
-            '--add-data=app;app',
-            '--hidden-import=playwright',
-            '--hidden-import=playwright._impl._api_types',
-            '--hidden-import=playwright.async_api',
-            '--hidden-import=asyncio',
-            '--hidden-import=keyring',
-            '--hidden-import=keyring.backends.Windows',
-            '--hidden-import=cryptography',
-            '--hidden-import=queue',
-            '--hidden-import=threading',
-            '--exclude-module=test_*',
-            '--exclude-module=validate_*',
-            '--exclude-module=tkinter.test',
-            '--exclude-module=unittest',
-            '--exclude-module=pydoc',
-            'main_gui.py'
-        ]
+        cmd = make_pyinstaller_cmd('JDPowerDownloader', windowed=True, extra_hidden=(
+            'playwright._impl._api_types',
+            'keyring',
+            'keyring.backends.Windows',
+            'cryptography',
+        ))
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        log_path = os.path.join(original_dir, 'build_JDPowerDownloader.log')
+        returncode = run_pyinstaller(cmd, log_path)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("SUCCESS! Executable created.")
             print("Location: dist/JDPowerDownloader.exe")
             
@@ -81,8 +64,7 @@ def main():
             return True
         else:
             print("ERROR: PyInstaller failed!")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
+            print(f"Full output in {log_path}")
             return False
             
     finally:
@@ -6,62 +6,49 @@ This keeps the current JDPowerDownloader_Clean_Distribution intact as a backup.
 
 import os
 import sys
-import shutil
-import subprocess
 from pathlib import Path
 
-def safe_rmtree(path):
-    """Safely remove directory tree, handling permission errors."""
-    if os.path.exists(path):
-        try:
-            shutil.rmtree(path)
-        except PermissionError:
-            print("You may need to close any running instances of the app")
+from build_common import (
+    BuildJob,
+    build_is_current,
+    fast_clone,
+    find_browser_dir,
+    make_pyinstaller_cmd,
+    remove_job_output,
+    run_pyinstaller,
+    safe_rmtree,
+    write_fingerprint,
+)
+
+def pyinstaller_job():
+    """Describe the PyInstaller build for this variant (windowed, no console)."""
+    # --onedir so the exe doesn't unpack itself on every launch
+    cmd = make_pyinstaller_cmd('JDPowerDownloader_Minimal', windowed=True, onefile=False)
+    return BuildJob('JDPowerDownloader_Minimal', cmd, os.path.join('build', 'JDPowerDownloader_Minimal'), 'dist')
 
 def build_minimal_executable():
     """Build a clean production version without console output."""
     print("Building minimal JDPowerDownloader.exe...")
     
-    # Clean previous builds
-    safe_rmtree('build')
-    safe_rmtree('dist')
-    
-    # Build PyInstaller command (WITH --windowed to hide console)
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        '--windowed',  # This hides the console window
-        '--name=JDPowerDownloader_Minimal',
-        '--add-data=jdp_scraper;jdp_scraper',
-        '--add-data=app;app',
-        '--collect-all=playwright',
-        '--hidden-import=playwright',
-        '--hidden-import=playwright.async_api',
-        '--hidden-import=asyncio',
-        '--hidden-import=queue',
-        '--hidden-import=threading',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.ttk',
-        '--exclude-module=test_*',
-        '--exclude-module=validate_*',
-        '--exclude-module=tkinter.test',
-        '--exclude-module=unittest',
-        '--exclude-module=pydoc',
-        'main_gui.py'
-    ]
+    job = pyinstaller_job()
+    if build_is_current(job):
+        print("Sources unchanged since last build (cache hit), skipping PyInstaller")
+        return True
+    
+    # Clean this variant's previous build (other variants stay cached)
+    remove_job_output(job)
+    
+    cmd = job.cmd
     
     print("Running PyInstaller...")
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("PyInstaller completed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"PyInstaller failed with exit code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+    log_path = f'build_{job.name}.log'
+    returncode = run_pyinstaller(cmd, log_path)
+    if returncode != 0:
+        print(f"PyInstaller failed with exit code {returncode} (full output in {log_path})")
         return False
+    print("PyInstaller completed successfully!")
+    write_fingerprint(job)
+    return True
 
 def create_minimal_distribution():
     """Create a minimal distribution package with only Chromium browser."""
@@ -73,12 +60,14 @@ def create_minimal_distribution():
         safe_rmtree(dist_dir)
     dist_dir.mkdir()
     
-    # Copy the minimal executable
-    exe_source = Path('dist/JDPowerDownloader_Minimal.exe')
+    # Copy the minimal executable folder (built with --onedir)
+    app_source = Path('dist/JDPowerDownloader_Minimal')
+    exe_source = app_source / 'JDPowerDownloader_Minimal.exe'
     exe_dest = dist_dir / 'JDPowerDownloader.exe'
     
     if exe_source.exists():
-        shutil.copy2(exe_source, exe_dest)
+        fast_clone(app_source, dist_dir)
+        os.replace(dist_dir / exe_source.name, exe_dest)
         print(f"[OK] Copied minimal executable: {exe_dest}")
     else:
         print(f"[ERROR] Executable not found: {exe_source}")
@@ -87,36 +76,38 @@ def create_minimal_distribution():
     # Create minimal ms-playwright directory
     playwright_dest = dist_dir / 'ms-playwright'
     playwright_dest.mkdir()
+    total_size = 0
     
     # Copy only the necessary browser files
     source_playwright = Path('JDPowerDownloader_Clean_Distribution/ms-playwright')
     
-    # Only copy Chromium-1187 (the one actually used by the app)
-    chromium_source = source_playwright / 'chromium-1187'
-    chromium_dest = playwright_dest / 'chromium-1187'
+    # Only copy Chromium (the one actually used by the app), whatever its revision
+    chromium_source = find_browser_dir(source_playwright)
     
-    if chromium_source.exists():
-        shutil.copytree(chromium_source, chromium_dest)
-        print(f"[OK] Copied Chromium-1187 browser (~360MB)")
+    if chromium_source is not None:
+        _, size = fast_clone(chromium_source, playwright_dest / chromium_source.name)
+        total_size += size
+        print(f"[OK] Copied {chromium_source.name} browser ({size / (1024 * 1024):.0f}MB)")
     else:
-        print(f"[ERROR] Chromium-1187 not found: {chromium_source}")
+        print(f"[ERROR] Chromium not found in: {source_playwright}")
         return False
     
-    # Copy winldd-1007 (small dependency, ~1MB)
-    winldd_source = source_playwright / 'winldd-1007'
-    winldd_dest = playwright_dest / 'winldd-1007'
+    # Copy winldd (small dependency, ~1MB)
+    winldd_source = find_browser_dir(source_playwright, 'winldd-')
     
-    if winldd_source.exists():
-        shutil.copytree(winldd_source, winldd_dest)
-        print(f"[OK] Copied winldd-1007 dependency (~1MB)")
+    if winldd_source is not None:
+        _, size = fast_clone(winldd_source, playwright_dest / winldd_source.name)
+        total_size += size
+        print(f"[OK] Copied {winldd_source.name} dependency ({size / (1024 * 1024):.1f}MB)")
     else:
-        print(f"[WARNING] winldd-1007 not found: {winldd_source}")
+        print(f"[WARNING] winldd not found in: {source_playwright}")
     
     # Copy .links directory if it exists (Playwright metadata)
     links_source = source_playwright / '.links'
     if links_source.exists():
         links_dest = playwright_dest / '.links'
-        shutil.copytree(links_source, links_dest)
+        _, size = fast_clone(links_source, links_dest)
+        total_size += size
         print(f"[OK] Copied .links metadata")
     
     # Create minimal README
@@ -127,7 +118,13 @@ The package size has been reduced from ~1.5GB to ~360MB by including only the Ch
 
 CONTENTS:
 - JDPowerDownloader.exe: The main application (no console window)
-- ms-playwright/: Minimal browser files (only Chromium-1187)
+- _internal/: Application libraries used by JDPowerDownloader.exe
+- ms-playwright/: Minimal browser files (Chromium only)
+
+This version is built as a folder rather than a single self-extracting file,
+so it starts faster: nothing has to be unpacked each time it launches.
+Keep JDPowerDownloader.exe next to the _internal folder - you still only
+double-click the one exe.
 
 HOW TO USE:
 1. Double-click "JDPowerDownloader.exe" to start the application
@@ -159,18 +156,17 @@ TROUBLESHOOTING:
 For support, contact the developer.
 '''
     
-    with open(dist_dir / 'README.txt', 'w') as f:
-        f.write(readme_content)
+    (dist_dir / 'README.txt').write_text(readme_content, encoding='utf-8', newline='\r\n')
     print("[OK] Created minimal README")
     
-    # Calculate size reduction
-    total_size = sum(f.stat().st_size for f in playwright_dest.rglob('*') if f.is_file())
+    # Size reduction, from the byte counts gathered while cloning
     total_size_mb = total_size / (1024 * 1024)
     
     print(f"\n[SUCCESS] Minimal distribution package created!")
     print(f"Location: {dist_dir.name}/")
     print(f"\nFiles included:")
     print(f"- JDPowerDownloader.exe (clean version, no console)")
+    print(f"- _internal/ (application libraries, --onedir build)")
     print(f"- ms-playwright/ (Chromium browser only)")
     print(f"- README.txt (user instructions)")
     print(f"\nSize reduction:")
@@ -1,59 +1,25 @@
 """
 Simple PyInstaller build script.
 """
-import subprocess
-import sys
 import os
+import sys
+
+from build_common import make_pyinstaller_cmd, playwright_browsers_dir, run_pyinstaller, safe_rmtree
 
 def main():
     print("Building JDPowerDownloader.exe...")
     
     # Clean previous builds
-    import shutil
-    
-    def safe_rmtree(path):
-        """Safely remove directory tree, handling permission errors."""
-        if os.path.exists(path):
-            try:
-                shutil.rmtree(path)
-            except PermissionError:
-                print(f"Warning: Could not remove {path} (permission denied)")
-                print("You may need to close any running instances of the app")
-    
-    safe_rmtree('build')
     safe_rmtree('dist')
     
-    # Run PyInstaller directly
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        # '--windowed',  # Commented out for debug version to see console output
-        '--name=JDPowerDownloader',
-        '--add-data=jdp_scraper;jdp_scraper',
-        '--add-data=app;app',
-        '--collect-all=playwright',
-        '--hidden-import=playwright',
-        '--hidden-import=playwright.async_api',
-        '--add-data=%LOCALAPPDATA%/ms-playwright;ms-playwright',
-        '--hidden-import=asyncio',
-        '--hidden-import=queue',
-        '--hidden-import=threading',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.ttk',
-        '--exclude-module=test_*',
-        '--exclude-module=validate_*',
-        '--exclude-module=tkinter.test',
-        '--exclude-module=unittest',
-        '--exclude-module=pydoc',
-        'main_gui.py'
-    ]
+    # Run PyInstaller directly (console kept for debugging)
+    cmd = make_pyinstaller_cmd('JDPowerDownloader', windowed=False,
+                               extra_data=(f'{playwright_browsers_dir()};ms-playwright',))
     
     print("Running PyInstaller...")
-    result = subprocess.run(cmd)
+    returncode = run_pyinstaller(cmd, 'build_JDPowerDownloader.log')
     
-    if result.returncode == 0:
+    if returncode == 0:
         print("SUCCESS! Executable created.")
         print("Location: dist/JDPowerDownloader.exe")
         
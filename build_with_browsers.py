@@ -4,92 +4,54 @@ Build script that creates a standalone executable with Playwright browsers bundl
 This ensures the executable works on fresh Windows machines without any dependencies.
 """
 
-import os
 import sys
-import shutil
-import subprocess
 from pathlib import Path
 
-def safe_rmtree(path):
-    """Safely remove directory tree, handling permission errors."""
-    if os.path.exists(path):
-        try:
-            shutil.rmtree(path)
-        except PermissionError:
-            print(f"Warning: Could not remove {path} (permission denied)")
-            print("You may need to close any running instances of the app")
-
-def get_playwright_browser_path():
-    """Get the path to Playwright browsers."""
-    import platformdirs
-    if os.name == 'nt':  # Windows
-        return os.path.join(os.environ.get('LOCALAPPDATA', ''), 'ms-playwright')
-    else:  # Unix-like
-        return os.path.expanduser('~/.local/share/ms-playwright')
+from build_common import (
+    find_browser_dir,
+    make_pyinstaller_cmd,
+    playwright_browsers_dir,
+    playwright_browsers_installed,
+    run_pyinstaller,
+    safe_rmtree,
+)
 
 def main():
     print("Building JDPowerDownloader.exe with bundled browsers...")
     
     # Clean previous builds
-    safe_rmtree('build')
     safe_rmtree('dist')
     
     # Get Playwright browser path
-    browser_path = get_playwright_browser_path()
+    browser_path = playwright_browsers_dir()
     print(f"Playwright browsers location: {browser_path}")
     
-    if not os.path.exists(browser_path):
+    if not playwright_browsers_installed():
         print(f"ERROR: Playwright browsers not found at {browser_path}")
         print("Please run: python -m playwright install chromium --with-deps")
         return False
     
     # Check if browsers are actually installed
-    chromium_path = os.path.join(browser_path, 'chromium-1187')
-    if not os.path.exists(chromium_path):
-        print(f"ERROR: Chromium browser not found at {chromium_path}")
+    chromium_path = find_browser_dir(browser_path)
+    if chromium_path is None:
+        print(f"ERROR: Chromium browser not found in {browser_path}")
         print("Please run: python -m playwright install chromium --with-deps")
         return False
     
     print(f"Found browsers at: {browser_path}")
     
-    # Build PyInstaller command
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        # '--windowed',  # Commented out for debug version to see console output
-        '--name=JDPowerDownloader',
-        '--add-data=jdp_scraper;jdp_scraper',
-        '--add-data=app;app',
-        '--collect-all=playwright',
-        '--hidden-import=playwright',
-        '--hidden-import=playwright.async_api',
-        f'--add-data={browser_path};ms-playwright',
-        '--hidden-import=asyncio',
-        '--hidden-import=queue',
-        '--hidden-import=threading',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.ttk',
-        '--exclude-module=test_*',
-        '--exclude-module=validate_*',
-        '--exclude-module=tkinter.test',
-        '--exclude-module=unittest',
-        '--exclude-module=pydoc',
-        'main_gui.py'
-    ]
+    # Build PyInstaller command (console kept for debugging)
+    cmd = make_pyinstaller_cmd('JDPowerDownloader', windowed=False,
+                               extra_data=(f'{browser_path};ms-playwright',))
     
     print("Running PyInstaller...")
     print("Command:", ' '.join(cmd))
     
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("PyInstaller completed successfully!")
-    except subprocess.CalledProcessError as e:
-        print(f"PyInstaller failed with exit code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+    returncode = run_pyinstaller(cmd, 'build_JDPowerDownloader.log')
+    if returncode != 0:
+        print(f"PyInstaller failed with exit code {returncode} (full output in build_JDPowerDownloader.log)")
         return False
+    print("PyInstaller completed successfully!")
     
     # Check if executable was created
     exe_path = Path('dist/JDPowerDownloader.exe')
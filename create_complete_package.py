@@ -3,7 +3,7 @@
 Create a complete distribution package that includes:
 1. The standalone executable (without browsers bundled)
 2. The Playwright browsers in a separate folder
-3. A launcher script that sets up the environment
+3. A runtime hook baked into the executable that finds those browsers
 
 This approach is better than bundling browsers into the executable because:
 - Smaller executable size
@@ -12,27 +12,19 @@ This approach is better than bundling browsers into the executable because:
 - More reliable on different systems
 """
 
-import os
 import sys
 import shutil
-import subprocess
 from pathlib import Path
 
-def safe_rmtree(path):
-    """Safely remove directory tree, handling permission errors."""
-    if os.path.exists(path):
-        try:
-            shutil.rmtree(path)
-        except PermissionError:
-            print(f"Warning: Could not remove {path} (permission denied)")
-            print("You may need to close any running instances of the app")
-
-def get_playwright_browser_path():
-    """Get the path to Playwright browsers."""
-    if os.name == 'nt':  # Windows
-        return os.path.join(os.environ.get('LOCALAPPDATA', ''), 'ms-playwright')
-    else:  # Unix-like
-        return os.path.expanduser('~/.local/share/ms-playwright')
+from build_common import (
+    clone_browsers,
+    make_pyinstaller_cmd,
+    playwright_browsers_dir,
+    run_pyinstaller,
+    safe_rmtree,
+    walk_collect,
+    zip_tree,
+)
 
 def build_executable():
     """Build the standalone executable without browsers."""
@@ -43,41 +35,16 @@ def build_executable():
     safe_rmtree('dist')
     
     # Build PyInstaller command (without browsers)
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        '--windowed',  # Windowed mode for end users
-        '--name=JDPowerDownloader',
-        '--add-data=jdp_scraper;jdp_scraper',
-        '--add-data=app;app',
-        '--collect-all=playwright',
-        '--hidden-import=playwright',
-        '--hidden-import=playwright.async_api',
-        '--hidden-import=asyncio',
-        '--hidden-import=queue',
-        '--hidden-import=threading',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.ttk',
-        '--exclude-module=test_*',
-        '--exclude-module=validate_*',
-        '--exclude-module=tkinter.test',
-        '--exclude-module=unittest',
-        '--exclude-module=pydoc',
-        'main_gui.py'
-    ]
+    cmd = make_pyinstaller_cmd('JDPowerDownloader', windowed=True)
     
     print("Running PyInstaller...")
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("PyInstaller completed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"PyInstaller failed with exit code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+    log_path = 'build_JDPowerDownloader.log'
+    returncode = run_pyinstaller(cmd, log_path)
+    if returncode != 0:
+        print(f"PyInstaller failed with exit code {returncode} (full output in {log_path})")
         return False
+    print("PyInstaller completed successfully!")
+    return True
 
 def create_distribution_package():
     """Create a complete distribution package."""
@@ -94,10 +61,10 @@ def create_distribution_package():
         return False
     
     # Get Playwright browser path
-    browser_path = get_playwright_browser_path()
+    browser_path = playwright_browsers_dir()
     print(f"Playwright browsers location: {browser_path}")
     
-    if not os.path.exists(browser_path):
+    if not browser_path.exists():
         print(f"ERROR: Playwright browsers not found at {browser_path}")
         print("Please run: python -m playwright install chromium --with-deps")
         return False
@@ -115,28 +82,8 @@ def create_distribution_package():
     
     # Copy browsers
     browsers_dest = dist_dir / 'ms-playwright'
-    shutil.copytree(browser_path, browsers_dest)
-    print(f"[OK] Copied Playwright browsers ({sum(f.stat().st_size for f in browsers_dest.rglob('*') if f.is_file()) / (1024*1024):.1f} MB)")
-    
-    # Create launcher script
-    launcher_content = '''@echo off
-REM JDPowerDownloader Launcher
-REM This script sets up the environment and launches the application
-
-echo Starting JDPowerDownloader...
-
-REM Set Playwright browser path
-set PLAYWRIGHT_BROWSERS_PATH=%~dp0ms-playwright
-
-REM Launch the application
-"%~dp0JDPowerDownloader.exe"
-
-pause
-'''
-    
-    with open(dist_dir / 'Launch_JDPowerDownloader.bat', 'w') as f:
-        f.write(launcher_content)
-    print("[OK] Created launcher script")
+    _, browsers_size = clone_browsers(browser_path, browsers_dest)
+    print(f"[OK] Copied Playwright browsers ({browsers_size / (1024*1024):.1f} MB)")
     
     # Create README
     readme_content = '''JDPowerDownloader - Complete Package
@@ -146,11 +93,9 @@ This package includes everything needed to run JDPowerDownloader on a fresh Wind
 CONTENTS:
 - JDPowerDownloader.exe: The main application
 - ms-playwright/: Browser files required for web scraping
-- Launch_JDPowerDownloader.bat: Easy launcher script
 
 HOW TO USE:
-1. Double-click "Launch_JDPowerDownloader.bat" to start the application
-2. Or run "JDPowerDownloader.exe" directly
+1. Double-click "JDPowerDownloader.exe" to start the application
 
 REQUIREMENTS:
 - Windows 10 or later
@@ -163,22 +108,24 @@ TROUBLESHOOTING:
 For support, contact the developer.
 '''
     
-    with open(dist_dir / 'README.txt', 'w') as f:
-        f.write(readme_content)
+    (dist_dir / 'README.txt').write_text(readme_content, encoding='utf-8', newline='\r\n')
     print("[OK] Created README")
     
-    # Calculate total size
-    total_size = sum(f.stat().st_size for f in dist_dir.rglob('*') if f.is_file())
+    # Calculate total size and the listing in one pass
+    entries = sorted(walk_collect(dist_dir))
+    total_size = sum(size for _, size in entries)
     
     print(f"\n[SUCCESS] Distribution package created!")
     print(f"Location: {dist_dir.name}/")
     print(f"Total size: {total_size / (1024*1024):.1f} MB")
     print(f"\nPackage contents:")
-    for item in sorted(dist_dir.rglob('*')):
-        if item.is_file():
-            rel_path = item.relative_to(dist_dir)
-            size_mb = item.stat().st_size / (1024*1024)
-            print(f"  {rel_path} ({size_mb:.1f} MB)")
+    for rel_path, size in entries:
+        print(f"  {rel_path} ({size / (1024*1024):.1f} MB)")
+    
+    # Also ship it as a single archive
+    zip_path = dist_dir.with_suffix('.zip')
+    zip_size = zip_tree(dist_dir, zip_path)
+    print(f"\n[OK] Created {zip_path.name} ({zip_size / (1024*1024):.1f} MB)")
     
     return True
 
@@ -191,8 +138,8 @@ def main():
         print("The package includes:")
         print("- Standalone executable")
         print("- Playwright browsers")
-        print("- Launcher script")
         print("- README with instructions")
+        print("- The same contents as a .zip for easy transfer")
     else:
         print("\n[FAILED] Could not create distribution package")
         return False
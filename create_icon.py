@@ -50,14 +50,8 @@ def create_app_icon():
     # Save as ICO file with multiple sizes
     icon_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
     
-    # Create list of images for ICO
-    ico_images = []
-    for ico_size in icon_sizes:
-        resized = img.resize(ico_size, Image.Resampling.LANCZOS)
-        ico_images.append(resized)
-    
-    # Save as ICO
-    img.save('app_icon.ico', format='ICO', sizes=[(img.width, img.height) for img in ico_images])
+    # Save as ICO; Pillow downsamples the master to each size itself
+    img.save('app_icon.ico', format='ICO', sizes=icon_sizes)
     print(f"Created app_icon.ico with sizes: {icon_sizes}")
     
     return 'app_icon.ico'
@@ -7,13 +7,19 @@ import os
 import sys
 import subprocess
 
+from build_common import find_browser_dir
+from launchers import FIXED_LAUNCHER, write_launcher
+
 def test_distribution():
     """Test the distribution package and debug issues."""
     print("Testing JDPowerDownloader distribution package...")
     
-    # Check if distribution folder exists
+    # Check if distribution folder exists, reading its listing once
     dist_dir = "JDPowerDownloader_Distribution"
-    if not os.path.exists(dist_dir):
+    try:
+        with os.scandir(dist_dir) as it:
+            present = {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
         print(f"ERROR: Distribution folder {dist_dir} not found")
         return False
     
@@ -24,24 +30,27 @@ def test_distribution():
     browser_path = os.path.join(dist_dir, "ms-playwright")
     launcher_path = os.path.join(dist_dir, "Launch_JDPowerDownloader.bat")
     
-    if not os.path.exists(exe_path):
+    if "JDPowerDownloader.exe" not in present:
         print(f"ERROR: Executable not found: {exe_path}")
         return False
     print(f"[OK] Found executable: {exe_path}")
     
-    if not os.path.exists(browser_path):
+    if "ms-playwright" not in present or not present["ms-playwright"].is_dir():
         print(f"ERROR: Browser folder not found: {browser_path}")
         return False
     print(f"[OK] Found browser folder: {browser_path}")
     
-    if not os.path.exists(launcher_path):
-        print(f"ERROR: Launcher script not found: {launcher_path}")
-        return False
-    print(f"[OK] Found launcher script: {launcher_path}")
+    # Newer packages set the browser path from a runtime hook instead
+    if "Launch_JDPowerDownloader.bat" in present:
+        print(f"[OK] Found launcher script: {launcher_path}")
+    else:
+        print(f"[INFO] No launcher script (not needed for runtime-hook builds): {launcher_path}")
     
-    # Check browser contents
-    chromium_path = os.path.join(browser_path, "chromium-1187")
-    if os.path.exists(chromium_path):
+    # Check browser contents; accept whichever chromium-<revision> is bundled
+    with os.scandir(browser_path) as it:
+        browser_names = sorted(entry.name for entry in it)
+    chromium_path = find_browser_dir(browser_path)
+    if chromium_path is not None:
         print(f"[OK] Found Chromium browser: {chromium_path}")
         chrome_exe = os.path.join(chromium_path, "chrome-win", "chrome.exe")
         if os.path.exists(chrome_exe):
@@ -50,7 +59,7 @@ def test_distribution():
             print(f"[ERROR] Chrome executable not found: {chrome_exe}")
             return False
     else:
-        print(f"[ERROR] Chromium browser not found: {chromium_path}")
+        print(f"[ERROR] Chromium browser not found in: {browser_path}")
         return False
     
     # Test environment variable setting
@@ -80,7 +89,7 @@ def test_distribution():
             else:
                 print(f"[ERROR] Expected browser path does not exist")
                 print(f"[INFO] Available browsers in {browser_path}:")
-                for item in os.listdir(browser_path):
+                for item in browser_names:
                     print(f"  - {item}")
                 return False
                 
@@ -95,43 +104,9 @@ def create_fixed_launcher():
     """Create a fixed launcher script that sets the environment correctly."""
     print("\nCreating fixed launcher script...")
     
-    launcher_content = '''@echo off
-REM JDPowerDownloader Launcher - Fixed Version
-REM This script sets up the environment and launches the application
-
-echo Starting JDPowerDownloader...
-echo Setting up browser environment...
-
-REM Get the directory where this script is located
-set SCRIPT_DIR=%~dp0
-
-REM Set Playwright browser path to the ms-playwright folder in the same directory
-set PLAYWRIGHT_BROWSERS_PATH=%SCRIPT_DIR%ms-playwright
-
-echo Browser path set to: %PLAYWRIGHT_BROWSERS_PATH%
-
-REM Verify the browser path exists
-if not exist "%PLAYWRIGHT_BROWSERS_PATH%" (
-    echo ERROR: Browser folder not found at: %PLAYWRIGHT_BROWSERS_PATH%
-    echo Please make sure the ms-playwright folder is in the same directory as this script.
-    pause
-    exit /b 1
-)
-
-echo Browser folder found. Launching application...
-
-REM Launch the application
-"%SCRIPT_DIR%JDPowerDownloader.exe"
-
-echo Application has closed.
-pause
-'''
-    
     dist_dir = "JDPowerDownloader_Distribution"
     launcher_path = os.path.join(dist_dir, "Launch_JDPowerDownloader_Fixed.bat")
-    
-    with open(launcher_path, 'w') as f:
-        f.write(launcher_content)
+    write_launcher(launcher_path, FIXED_LAUNCHER)
     
     print(f"[OK] Created fixed launcher: {launcher_path}")
     return launcher_path
@@ -6,7 +6,7 @@ This will help us fix the "incorrect username or password" issue.
 
 import asyncio
 import os
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 
 async def debug_login_selectors():
     """Debug the login page to find the correct field selectors."""
@@ -19,8 +19,7 @@ async def debug_login_selectors():
     
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=False)  # Show browser for debugging
-        context = await browser.new_context()
-        page = await context.new_page()
+        page = await browser.new_page()
         
         try:
             print("Navigating to JD Power login page...")
@@ -28,55 +27,61 @@ async def debug_login_selectors():
             
             print("Page loaded. Looking for login form elements...")
             
-            # Wait a moment for the page to fully load
-            await page.wait_for_timeout(3000)
+            # Wait for the form to render instead of sleeping a fixed time
+            try:
+                await page.locator('input').first.wait_for(state='attached', timeout=5000)
+            except PlaywrightTimeoutError:
+                print("No input fields appeared within 5 seconds")
+            
+            # Read every attribute in one round-trip per element type
+            # instead of one get_attribute() call per attribute
+            inputs = await page.eval_on_selector_all('input', """els => els.map(e => ({
+                type: e.getAttribute('type'),
+                id: e.getAttribute('id'),
+                name: e.getAttribute('name'),
+                class: e.getAttribute('class'),
+                placeholder: e.getAttribute('placeholder'),
+            }))""")
+            buttons = await page.eval_on_selector_all('button, input[type="submit"], input[type="button"]', """els => els.map(e => ({
+                type: e.getAttribute('type'),
+                id: e.getAttribute('id'),
+                class: e.getAttribute('class'),
+                text: e.innerText,
+            }))""")
+            forms = await page.eval_on_selector_all('form', """els => els.map(e => ({
+                id: e.getAttribute('id'),
+                class: e.getAttribute('class'),
+                action: e.getAttribute('action'),
+            }))""")
             
             # Look for all input fields on the page
             print("\n=== ALL INPUT FIELDS ON THE PAGE ===")
-            inputs = await page.query_selector_all('input')
-            for i, input_elem in enumerate(inputs):
-                input_type = await input_elem.get_attribute('type')
-                input_id = await input_elem.get_attribute('id')
-                input_name = await input_elem.get_attribute('name')
-                input_class = await input_elem.get_attribute('class')
-                placeholder = await input_elem.get_attribute('placeholder')
-                
+            for i, input_info in enumerate(inputs):
                 print(f"Input {i+1}:")
-                print(f"  Type: {input_type}")
-                print(f"  ID: {input_id}")
-                print(f"  Name: {input_name}")
-                print(f"  Class: {input_class}")
-                print(f"  Placeholder: {placeholder}")
+                print(f"  Type: {input_info['type']}")
+                print(f"  ID: {input_info['id']}")
+                print(f"  Name: {input_info['name']}")
+                print(f"  Class: {input_info['class']}")
+                print(f"  Placeholder: {input_info['placeholder']}")
                 print()
             
             # Look for all buttons on the page
             print("\n=== ALL BUTTONS ON THE PAGE ===")
-            buttons = await page.query_selector_all('button, input[type="submit"], input[type="button"]')
-            for i, button_elem in enumerate(buttons):
-                button_type = await button_elem.get_attribute('type')
-                button_id = await button_elem.get_attribute('id')
-                button_class = await button_elem.get_attribute('class')
-                button_text = await button_elem.inner_text()
-                
+            for i, button_info in enumerate(buttons):
                 print(f"Button {i+1}:")
-                print(f"  Type: {button_type}")
-                print(f"  ID: {button_id}")
-                print(f"  Class: {button_class}")
-                print(f"  Text: '{button_text}'")
+                print(f"  Type: {button_info['type']}")
+                print(f"  ID: {button_info['id']}")
+                print(f"  Class: {button_info['class']}")
+                print(f"  Text: '{button_info['text']}'")
                 print()
             
             # Look for form elements
             print("\n=== ALL FORM ELEMENTS ===")
-            forms = await page.query_selector_all('form')
-            for i, form_elem in enumerate(forms):
-                form_id = await form_elem.get_attribute('id')
-                form_class = await form_elem.get_attribute('class')
-                form_action = await form_elem.get_attribute('action')
-                
+            for i, form_info in enumerate(forms):
                 print(f"Form {i+1}:")
-                print(f"  ID: {form_id}")
-                print(f"  Class: {form_class}")
-                print(f"  Action: {form_action}")
+                print(f"  ID: {form_info['id']}")
+                print(f"  Class: {form_info['class']}")
+                print(f"  Action: {form_info['action']}")
                 print()
             
             print("\n=== DEBUGGING COMPLETE ===")
@@ -5,8 +5,11 @@ This should help with the browser path issue.
 """
 
 import os
+import sys
 from pathlib import Path
 
+from launchers import DEBUG_LAUNCHER, FIXED_LAUNCHER, write_launcher
+
 def fix_launcher_script():
     """Update the launcher script with better browser path handling."""
     print("Fixing launcher script in existing distribution package...")
@@ -16,106 +19,13 @@ def fix_launcher_script():
         print(f"ERROR: Distribution package not found: {dist_dir}")
         return False
     
-    # Create improved launcher script
-    launcher_content = '''@echo off
-REM JDPowerDownloader Launcher - Fixed Version
-REM This script sets up the environment and launches the application
-
-echo Starting JDPowerDownloader...
-echo Setting up browser environment...
-
-REM Get the directory where this script is located
-set SCRIPT_DIR=%~dp0
-
-REM Set Playwright browser path to the ms-playwright folder in the same directory
-set PLAYWRIGHT_BROWSERS_PATH=%SCRIPT_DIR%ms-playwright
-
-echo Browser path set to: %PLAYWRIGHT_BROWSERS_PATH%
-
-REM Verify the browser path exists
-if not exist "%PLAYWRIGHT_BROWSERS_PATH%" (
-    echo ERROR: Browser folder not found at: %PLAYWRIGHT_BROWSERS_PATH%
-    echo Please make sure the ms-playwright folder is in the same directory as this script.
-    echo.
-    echo Available files in this directory:
-    dir /b
-    echo.
-    pause
-    exit /b 1
-)
-
-echo Browser folder found. Checking for Chromium...
-
-REM Check for Chromium specifically
-set CHROMIUM_PATH=%PLAYWRIGHT_BROWSERS_PATH%\\chromium-1187\\chrome-win\\chrome.exe
-if not exist "%CHROMIUM_PATH%" (
-    echo ERROR: Chromium browser not found at: %CHROMIUM_PATH%
-    echo Available browsers:
-    dir /b "%PLAYWRIGHT_BROWSERS_PATH%"
-    echo.
-    pause
-    exit /b 1
-)
-
-echo Chromium browser found. Launching application...
-
-REM Launch the application
-"%SCRIPT_DIR%JDPowerDownloader.exe"
-
-echo Application has closed.
-pause
-'''
-    
     # Update the launcher script
-    launcher_path = dist_dir / 'Launch_JDPowerDownloader.bat'
-    with open(launcher_path, 'w') as f:
-        f.write(launcher_content)
+    launcher_path = write_launcher(dist_dir / 'Launch_JDPowerDownloader.bat', FIXED_LAUNCHER)
     
     print(f"[OK] Updated launcher script: {launcher_path}")
     
     # Also create a debug launcher that shows console output
-    debug_launcher_content = '''@echo off
-REM JDPowerDownloader Debug Launcher
-REM This version shows console output to help debug issues
-
-echo Starting JDPowerDownloader Debug Version...
-echo This version will show console output to help debug issues.
-echo.
-
-REM Get the directory where this script is located
-set SCRIPT_DIR=%~dp0
-
-REM Set Playwright browser path to the ms-playwright folder in the same directory
-set PLAYWRIGHT_BROWSERS_PATH=%SCRIPT_DIR%ms-playwright
-
-echo Browser path set to: %PLAYWRIGHT_BROWSERS_PATH%
-
-REM Verify the browser path exists
-if not exist "%PLAYWRIGHT_BROWSERS_PATH%" (
-    echo ERROR: Browser folder not found at: %PLAYWRIGHT_BROWSERS_PATH%
-    echo Please make sure the ms-playwright folder is in the same directory as this script.
-    pause
-    exit /b 1
-)
-
-echo Browser folder found. Launching application...
-echo.
-echo NOTE: You will see console output that will help identify any issues.
-echo.
-
-REM Launch the application (this will show console output)
-REM We need to run the executable directly to see console output
-cd /d "%SCRIPT_DIR%"
-JDPowerDownloader.exe
-
-echo.
-echo Application has closed.
-pause
-'''
-    
-    debug_launcher_path = dist_dir / 'Launch_Debug.bat'
-    with open(debug_launcher_path, 'w') as f:
-        f.write(debug_launcher_content)
+    debug_launcher_path = write_launcher(dist_dir / 'Launch_Debug.bat', DEBUG_LAUNCHER)
     
     print(f"[OK] Created debug launcher script: {debug_launcher_path}")
     
@@ -5,8 +5,8 @@ Provides AsyncSemaphorePool for managing concurrent task execution with statisti
 """
 
 import asyncio
+import time
 from typing import Dict, Any
-from datetime import datetime
 
 
 class AsyncSemaphorePool:
@@ -17,7 +17,7 @@ class AsyncSemaphorePool:
     - Concurrency limiting via semaphore
     - Task tracking (active, completed, failed)
     - Performance statistics
-    - Thread-safe operations with asyncio.Lock
+    - Lock-free statistics: event-loop-affine, not cross-thread safe
     
     Example:
         pool = AsyncSemaphorePool(max_concurrent=5)
@@ -36,16 +36,22 @@ class AsyncSemaphorePool:
         self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
         
-        # Statistics tracking (thread-safe with lock)
-        self._lock = asyncio.Lock()
+        # Statistics tracking. Only touched from the event loop thread and
+        # never across an await, so no lock is needed.
         self._active_count = 0
         self._completed_count = 0
         self._failed_count = 0
         self._total_started = 0
         
-        # Timing
-        self._started_at = datetime.utcnow()
-        self._task_times = []
+        # Timing (monotonic clock; only durations are reported)
+        self._started_at = time.monotonic()
+        
+        # Running duration aggregates, so memory and stats cost stay O(1)
+        # however many tasks a session runs
+        self._duration_count = 0
+        self._duration_sum = 0.0
+        self._duration_min = 0.0
+        self._duration_max = 0.0
     
     def acquire(self):
         """
@@ -72,27 +78,32 @@ class AsyncSemaphorePool:
             """Acquire semaphore and increment active count."""
             await self.pool.semaphore.acquire()
             
-            async with self.pool._lock:
-                self.pool._active_count += 1
-                self.pool._total_started += 1
-                
-            self.task_start = datetime.utcnow()
+            self.pool._active_count += 1
+            self.pool._total_started += 1
+            self.task_start = time.monotonic()
             return self
             
         async def __aexit__(self, exc_type, exc_val, exc_tb):
             """Release semaphore and update statistics."""
-            task_duration = (datetime.utcnow() - self.task_start).total_seconds()
+            task_duration = time.monotonic() - self.task_start
+            
+            pool = self.pool
+            pool._active_count -= 1
+            if pool._duration_count == 0:
+                pool._duration_min = pool._duration_max = task_duration
+            elif task_duration < pool._duration_min:
+                pool._duration_min = task_duration
+            elif task_duration > pool._duration_max:
+                pool._duration_max = task_duration
+            pool._duration_count += 1
+            pool._duration_sum += task_duration
             
-            async with self.pool._lock:
-                self.pool._active_count -= 1
-                self.pool._task_times.append(task_duration)
+            if exc_type is None:
+                pool._completed_count += 1
+            else:
+                pool._failed_count += 1
                 
-                if exc_type is None:
-                    self.pool._completed_count += 1
-                else:
-                    self.pool._failed_count += 1
-                    
-            self.pool.semaphore.release()
+            pool.semaphore.release()
             return False  # Don't suppress exceptions
     
     async def get_statistics(self) -> Dict[str, Any]:
@@ -102,26 +113,25 @@ class AsyncSemaphorePool:
         Returns:
             Dictionary containing pool statistics
         """
-        async with self._lock:
-            stats = {
-                'active': self._active_count,
-                'completed': self._completed_count,
-                'failed': self._failed_count,
-                'total_started': self._total_started,
-                'max_concurrent': self.max_concurrent,
-            }
+        stats = {
+            'active': self._active_count,
+            'completed': self._completed_count,
+            'failed': self._failed_count,
+            'total_started': self._total_started,
+            'max_concurrent': self.max_concurrent,
+        }
+        
+        if self._duration_count:
+            stats['avg_duration'] = self._duration_sum / self._duration_count
+            stats['min_duration'] = self._duration_min
+            stats['max_duration'] = self._duration_max
+        else:
+            stats['avg_duration'] = 0
+            stats['min_duration'] = 0
+            stats['max_duration'] = 0
+            
+        stats['uptime'] = time.monotonic() - self._started_at
             
-            if self._task_times:
-                stats['avg_duration'] = sum(self._task_times) / len(self._task_times)
-                stats['min_duration'] = min(self._task_times)
-                stats['max_duration'] = max(self._task_times)
-            else:
-                stats['avg_duration'] = 0
-                stats['min_duration'] = 0
-                stats['max_duration'] = 0
-                
-            stats['uptime'] = (datetime.utcnow() - self._started_at).total_seconds()
-                
         return stats
     
     async def print_statistics(self) -> None:
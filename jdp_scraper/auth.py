@@ -5,9 +5,13 @@ Responsibilities:
 - Enter credentials from env
 - Submit and verify login success
 """
+import logging
+
 from playwright.sync_api import Page
 from jdp_scraper import config, selectors
 
+log = logging.getLogger(__name__)
+
 
 def login(page: Page) -> bool:
     """
@@ -20,39 +24,44 @@ def login(page: Page) -> bool:
         True if login successful, False otherwise
     """
     try:
-        print("Starting login process...")
+        log.info("Starting login process...")
         
         # Debug: Show what we're using
-        print(f"DEBUG - Username from config: '{config.JD_USER}' (length: {len(config.JD_USER)})")
-        print(f"DEBUG - Password from config: {'*' * len(config.JD_PASS)} (length: {len(config.JD_PASS)})")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Username from config: '%s' (length: %d)", config.JD_USER, len(config.JD_USER))
+            log.debug("Password from config: %s (length: %d)", config.PW_MASK, len(config.PW_MASK))
         
         # Wait for login form to be visible
         page.wait_for_selector(selectors.USERNAME_INPUT, state="visible")
         
         # Fill in username
-        print(f"Entering username: {config.JD_USER}")
+        log.info("Entering username: %s", config.JD_USER)
         page.fill(selectors.USERNAME_INPUT, config.JD_USER)
         
-        # Verify username was filled
-        username_value = page.input_value(selectors.USERNAME_INPUT)
-        print(f"DEBUG - Username field value after fill: '{username_value}'")
+        # Verify username was filled (costs a round-trip, so only when debugging)
+        if log.isEnabledFor(logging.DEBUG):
+            username_value = page.input_value(selectors.USERNAME_INPUT)
+            log.debug("Username field value after fill: '%s'", username_value)
         
         # Fill in password
-        print("Entering password...")
+        log.info("Entering password...")
         page.fill(selectors.PASSWORD_INPUT, config.JD_PASS)
         
-        # Click login button
-        print("Clicking login button...")
-        page.click(selectors.LOGIN_BUTTON)
+        # Click login button, listening for the navigation before clicking so
+        # a fast redirect can't complete before we start waiting for it
+        log.info("Clicking login button...")
+        with page.expect_navigation(wait_until="domcontentloaded", timeout=config.DEFAULT_TIMEOUT):
+            page.click(selectors.LOGIN_BUTTON)
         
-        # Wait for navigation after login (adjust as needed)
-        print("Waiting for login to complete...")
-        page.wait_for_load_state("networkidle")
+        # Logged in once the login form is gone from the new page
+        # (networkidle waited out analytics traffic for no benefit)
+        log.info("Waiting for login to complete...")
+        page.wait_for_selector(selectors.USERNAME_INPUT, state="detached", timeout=config.DEFAULT_TIMEOUT)
         
-        print("[SUCCESS] Login completed successfully!")
+        log.info("[SUCCESS] Login completed successfully!")
         return True
         
     except Exception as e:
-        print(f"[ERROR] Login failed: {e}")
+        log.error("[ERROR] Login failed: %s", e)
         return False
 
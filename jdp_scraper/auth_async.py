@@ -5,9 +5,13 @@ Responsibilities:
 - Enter credentials from env
 - Submit and verify login success
 """
+import logging
+
 from playwright.async_api import Page
 from jdp_scraper import config, selectors
 
+log = logging.getLogger(__name__)
+
 
 async def login_async(page: Page, username: str = None, password: str = None) -> bool:
     """
@@ -22,38 +26,44 @@ async def login_async(page: Page, username: str = None, password: str = None) ->
         True if login successful, False otherwise
     """
     try:
-        print("Starting login process...")
+        log.info("Starting login process...")
         
         # Use provided credentials or fall back to environment variables
         login_username = username if username is not None else config.JD_USER
         login_password = password if password is not None else config.JD_PASS
         
-        print(f"DEBUG: Using username: '{login_username}'")
-        print(f"DEBUG: Using password: {'*' * len(login_password) if login_password else 'EMPTY'}")
+        if log.isEnabledFor(logging.DEBUG):
+            # Only a GUI-supplied password needs a mask built here
+            pw_mask = config.PW_MASK if password is None else '*' * len(login_password)
+            log.debug("Using username: '%s'", login_username)
+            log.debug("Using password: %s", pw_mask or 'EMPTY')
         
         # Wait for login form to be visible
-        print(f"Waiting for username input: {selectors.USERNAME_INPUT}")
+        log.debug("Waiting for username input: %s", selectors.USERNAME_INPUT)
         await page.wait_for_selector(selectors.USERNAME_INPUT, state="visible", timeout=10000)
         
         # Fill in username
-        print(f"Entering username: {login_username}")
+        log.info("Entering username: %s", login_username)
         await page.fill(selectors.USERNAME_INPUT, login_username)
         
         # Fill in password
-        print("Entering password...")
+        log.info("Entering password...")
         await page.fill(selectors.PASSWORD_INPUT, login_password)
         
-        # Click login button
-        print("Clicking login button...")
-        await page.click(selectors.LOGIN_BUTTON)
+        # Click login button, listening for the navigation before clicking so
+        # a fast redirect can't complete before we start waiting for it
+        log.info("Clicking login button...")
+        async with page.expect_navigation(wait_until="domcontentloaded", timeout=config.DEFAULT_TIMEOUT):
+            await page.click(selectors.LOGIN_BUTTON)
         
-        # Wait for navigation after login
-        print("Waiting for login to complete...")
-        await page.wait_for_load_state("networkidle")
+        # Logged in once the login form is gone from the new page
+        # (networkidle waited out analytics traffic for no benefit)
+        log.info("Waiting for login to complete...")
+        await page.wait_for_selector(selectors.USERNAME_INPUT, state="detached", timeout=config.DEFAULT_TIMEOUT)
         
-        print("[SUCCESS] Login completed successfully!")
+        log.info("[SUCCESS] Login completed successfully!")
         return True
         
     except Exception as e:
-        print(f"[ERROR] Login failed: {e}")
+        log.error("[ERROR] Login failed: %s", e)
         return False
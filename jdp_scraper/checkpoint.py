@@ -1,7 +1,10 @@
 """Checkpoint and recovery system for robust long-running downloads.
 
 This module provides mechanisms to:
-- Save progress checkpoints after each successful download
+- Append every result to a small log (checkpoint.log) as it happens
+- Compact the log into the checkpoint.json snapshot in batches (every
+  CHECKPOINT_EVERY results or every few seconds, plus a final flush)
+- Keep all of that disk I/O on a background writer thread, off the event loop
 - Detect when the automation is stuck (consecutive failures)
 - Recover from failures by restarting from the last good state
 - Validate that forward progress is being made
@@ -9,27 +12,50 @@ This module provides mechanisms to:
 Thread-safe for async operations using asyncio.Lock.
 """
 import asyncio
+import atexit
 import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from jdp_scraper import config
 
+# orjson is optional - it serializes straight to bytes, several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compact the log into the snapshot after this many recorded results...
+SAVE_EVERY = int(os.getenv("CHECKPOINT_EVERY", "25"))
+# ...or once this many seconds have passed since the last compaction
+SAVE_INTERVAL = 5.0
+
 
 class ProgressCheckpoint:
     """Manages checkpoints for resumable downloads (thread-safe for async)."""
     
-    def __init__(self, checkpoint_file: str = None):
+    def __init__(
+        self,
+        checkpoint_file: str = None,
+        progress_callback: Optional[Callable[["ProgressCheckpoint", str, str], None]] = None
+    ):
         """
         Initialize checkpoint manager.
         
         Args:
             checkpoint_file: Path to checkpoint file (default: in RUN_DIR)
+            progress_callback: Optional plain function called as
+                callback(checkpoint, reference_number, status) after each
+                recorded result, where status is 'success' or 'failure'
         """
         if checkpoint_file is None:
             checkpoint_file = os.path.join(config.DATA_DIR(), "checkpoint.json")
         
         self.checkpoint_file = checkpoint_file
+        self.log_file = os.path.splitext(checkpoint_file)[0] + ".log"
         self.consecutive_failures = 0
         self.last_successful_ref = None
         self.total_processed = 0
@@ -38,24 +64,49 @@ class ProgressCheckpoint:
         self.browser_restarts = 0
         self.started_at = datetime.utcnow().isoformat()
         self.last_checkpoint_at = None
+        self._progress_cb = progress_callback
+        
+        # Results recorded since the last write
+        self._dirty_since_save = 0
+        self._save_every = SAVE_EVERY
+        self._last_save_ts = time.monotonic()
         
         # Thread-safety for async operations
         self._lock = asyncio.Lock()
         
         # Load existing checkpoint if it exists
         self.load()
+        
+        # Results since the last snapshot are appended here, one line each
+        os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+        self._log_fh = open(self.log_file, 'ab', buffering=0)
+        
+        # Log lines and snapshots are written by this thread, so workers on
+        # the event loop never block on disk I/O
+        self._queue = queue.Queue()
+        self._write_ok = True
+        self._writer = threading.Thread(target=self._writer_loop, name="checkpoint-writer", daemon=True)
+        self._writer.start()
+        
+        # Don't lose a partial batch if the process exits without flush()
+        atexit.register(self.close)
     
     def load(self) -> bool:
         """
         Load checkpoint from disk if it exists.
         
+        Reads the checkpoint.json snapshot, then replays any results that
+        were logged after it was written.
+        
         Returns:
             True if checkpoint was loaded, False if starting fresh
         """
         try:
+            loaded = False
             if os.path.exists(self.checkpoint_file):
-                with open(self.checkpoint_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.checkpoint_file, 'rb') as f:
+                    raw = f.read()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     self.consecutive_failures = data.get('consecutive_failures', 0)
                     self.last_successful_ref = data.get('last_successful_ref')
                     self.total_processed = data.get('total_processed', 0)
@@ -64,46 +115,246 @@ class ProgressCheckpoint:
                     self.browser_restarts = data.get('browser_restarts', 0)
                     self.started_at = data.get('started_at', self.started_at)
                     self.last_checkpoint_at = data.get('last_checkpoint_at')
-                    print(f"[CHECKPOINT] Loaded existing checkpoint")
-                    print(f"[CHECKPOINT] Last successful: {self.last_successful_ref}")
-                    print(f"[CHECKPOINT] Progress: {self.total_succeeded} succeeded, {self.total_failed} failed")
-                    return True
+                    loaded = True
+            
+            replayed = self._replay_log()
+            # Fold replayed results into the snapshot at the next compaction
+            self._dirty_since_save += replayed
+            if loaded or replayed:
+                print(f"[CHECKPOINT] Loaded existing checkpoint")
+                if replayed:
+                    print(f"[CHECKPOINT] Replayed {replayed} logged results")
+                print(f"[CHECKPOINT] Last successful: {self.last_successful_ref}")
+                print(f"[CHECKPOINT] Progress: {self.total_succeeded} succeeded, {self.total_failed} failed")
+                return True
         except Exception as e:
             print(f"[CHECKPOINT] Could not load checkpoint: {e}")
         
         return False
     
+    def _replay_log(self) -> int:
+        """
+        Apply results from checkpoint.log that the snapshot doesn't include.
+        
+        Each line carries the total_processed count after that result, so
+        lines already covered by the snapshot are skipped.
+        
+        Returns:
+            Number of results replayed
+        """
+        if not os.path.exists(self.log_file):
+            return 0
+        
+        replayed = 0
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    break  # Torn last line from a crash mid-write
+                if entry['n'] <= self.total_processed:
+                    continue
+                if 's' in entry:
+                    self._apply_success(entry['s'])
+                else:
+                    self._apply_failure(entry['f'])
+                replayed += 1
+        return replayed
+    
+    def _apply_success(self, reference_number: str) -> None:
+        self.consecutive_failures = 0
+        self.last_successful_ref = reference_number
+        self.total_processed += 1
+        self.total_succeeded += 1
+    
+    def _apply_failure(self, reference_number: str) -> None:
+        self.consecutive_failures += 1
+        self.total_processed += 1
+        self.total_failed += 1
+    
+    def _submit(self, kind: str, value) -> None:
+        """
+        Hand a log line or snapshot to the writer thread (caller holds the lock).
+        
+        Once close() has stopped the writer, it is written here instead, so
+        results and saves after close() are still kept.
+        """
+        if self._writer.is_alive():
+            self._queue.put_nowait((kind, value))
+        elif kind == 'log':
+            self._write_lines([value])
+        else:
+            self._write_ok = self._write_snapshot(value)
+    
+    def _append_log(self, entry: dict) -> None:
+        """Queue one result line for checkpoint.log (caller holds the lock)."""
+        self._submit('log', entry)
+    
+    def _queue_snapshot(self) -> None:
+        """Queue a snapshot of the current state (caller holds the lock)."""
+        data = {
+            'consecutive_failures': self.consecutive_failures,
+            'last_successful_ref': self.last_successful_ref,
+            'total_processed': self.total_processed,
+            'total_succeeded': self.total_succeeded,
+            'total_failed': self.total_failed,
+            'browser_restarts': self.browser_restarts,
+            'started_at': self.started_at,
+            'last_checkpoint_at': datetime.utcnow().isoformat()
+        }
+        self._submit('snapshot', data)
+        self.last_checkpoint_at = data['last_checkpoint_at']
+        self._dirty_since_save = 0
+        self._last_save_ts = time.monotonic()
+    
+    def _snapshot_if_due(self) -> None:
+        """Snapshot once a full batch is pending or the save interval has passed."""
+        if (self._dirty_since_save >= self._save_every
+                or time.monotonic() - self._last_save_ts > SAVE_INTERVAL):
+            self._queue_snapshot()
+    
+    async def _wait_for_writer(self) -> bool:
+        """Wait (off the event loop) until everything queued so far is written."""
+        if not self._writer.is_alive():
+            return self._write_ok  # Closed: _submit() already wrote it
+        done = threading.Event()
+        self._queue.put_nowait(('sync', done))
+        await asyncio.to_thread(done.wait)
+        return self._write_ok
+    
+    def _writer_loop(self) -> None:
+        """
+        Background thread: write queued log lines and snapshots.
+        
+        Everything queued since the last pass is handled together: log lines
+        become one write() call, and lines already covered by a newer
+        snapshot are dropped once that snapshot is on disk.
+        """
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            covered, lines, snapshot, waiters, stop = [], [], None, [], False
+            for kind, value in items:
+                if kind == 'log':
+                    lines.append(value)
+                elif kind == 'snapshot':
+                    covered += lines
+                    lines = []
+                    snapshot = value
+                elif kind == 'sync':
+                    waiters.append(value)
+                else:
+                    stop = True
+            
+            if snapshot is not None:
+                self._write_ok = self._write_snapshot(snapshot)
+                if not self._write_ok:
+                    # Keep them in the log so load() can still replay them
+                    self._write_lines(covered)
+            self._write_lines(lines)
+            
+            for done in waiters:
+                done.set()
+            if stop:
+                return
+    
+    def _write_lines(self, entries: list) -> None:
+        """Append result lines to checkpoint.log in one write."""
+        if not entries:
+            return
+        try:
+            if orjson is not None:
+                payload = b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+            else:
+                payload = "".join(json.dumps(entry, separators=(',', ':')) + "\n" for entry in entries).encode("utf-8")
+            if self._log_fh.closed:
+                with open(self.log_file, 'ab') as f:
+                    f.write(payload)
+            else:
+                self._log_fh.write(payload)
+        except Exception as e:
+            print(f"[CHECKPOINT] Could not append to checkpoint log: {e}")
+    
+    def _write_snapshot(self, data: dict) -> bool:
+        """
+        Write the checkpoint.json snapshot and truncate checkpoint.log.
+        
+        Runs on the writer thread, or the caller's once it has stopped.
+        
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
+            
+            # Compact, not indented - print_status() is the readable view
+            if orjson is not None:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, separators=(',', ':')).encode("utf-8")
+            # One write to a temp file, one fsync, then swap it in so a crash
+            # can never leave a truncated checkpoint.json for load()
+            tmp_file = self.checkpoint_file + ".tmp"
+            with open(tmp_file, 'wb', buffering=0) as f:
+                f.write(payload)
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.checkpoint_file)
+            
+            # Everything logged so far is now in the snapshot
+            if self._log_fh.closed:
+                open(self.log_file, 'wb').close()
+            else:
+                self._log_fh.truncate(0)
+            return True
+            
+        except Exception as e:
+            print(f"[CHECKPOINT] Could not save checkpoint: {e}")
+            return False
+    
     async def save(self) -> bool:
         """
         Save current checkpoint to disk (thread-safe).
         
+        The write happens on the background writer thread; this waits for
+        it without blocking the event loop.
+        
         Returns:
             True if saved successfully, False otherwise
         """
         async with self._lock:
-            try:
-                os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
-                
-                data = {
-                    'consecutive_failures': self.consecutive_failures,
-                    'last_successful_ref': self.last_successful_ref,
-                    'total_processed': self.total_processed,
-                    'total_succeeded': self.total_succeeded,
-                    'total_failed': self.total_failed,
-                    'browser_restarts': self.browser_restarts,
-                    'started_at': self.started_at,
-                    'last_checkpoint_at': datetime.utcnow().isoformat()
-                }
-                
-                with open(self.checkpoint_file, 'w') as f:
-                    json.dump(data, f, indent=2)
-                
-                self.last_checkpoint_at = data['last_checkpoint_at']
-                return True
-                
-            except Exception as e:
-                print(f"[CHECKPOINT] Could not save checkpoint: {e}")
-                return False
+            self._queue_snapshot()
+        return await self._wait_for_writer()
+    
+    async def flush(self) -> bool:
+        """
+        Save any results recorded since the last save (thread-safe).
+        
+        Call this when the run ends so the final partial batch is kept.
+        
+        Returns:
+            True if saved (or nothing was pending), False on error
+        """
+        async with self._lock:
+            if self._dirty_since_save:
+                self._queue_snapshot()
+        return await self._wait_for_writer()
+    
+    def close(self) -> None:
+        """Save a pending partial batch, stop the writer thread and close the log."""
+        if not self._writer.is_alive():
+            return
+        atexit.unregister(self.close)
+        if self._dirty_since_save:
+            self._queue_snapshot()
+        self._queue.put_nowait(('stop', None))
+        self._writer.join()
+        self._log_fh.close()
     
     async def record_success(self, reference_number: str) -> None:
         """
@@ -113,11 +364,13 @@ class ProgressCheckpoint:
             reference_number: The reference number that succeeded
         """
         async with self._lock:
-            self.consecutive_failures = 0
-            self.last_successful_ref = reference_number
-            self.total_processed += 1
-            self.total_succeeded += 1
-        await self.save()
+            self._apply_success(reference_number)
+            self._append_log({'s': reference_number, 'n': self.total_processed})
+            self._dirty_since_save += 1
+            self._snapshot_if_due()
+        
+        if self._progress_cb:
+            self._progress_cb(self, reference_number, 'success')
     
     async def record_failure(self, reference_number: str) -> None:
         """
@@ -127,10 +380,13 @@ class ProgressCheckpoint:
             reference_number: The reference number that failed
         """
         async with self._lock:
-            self.consecutive_failures += 1
-            self.total_processed += 1
-            self.total_failed += 1
-        await self.save()
+            self._apply_failure(reference_number)
+            self._append_log({'f': reference_number, 'n': self.total_processed})
+            self._dirty_since_save += 1
+            self._snapshot_if_due()
+        
+        if self._progress_cb:
+            self._progress_cb(self, reference_number, 'failure')
     
     def is_stuck(self, threshold: int = 5) -> bool:
         """
@@ -4,6 +4,8 @@ Environment:
 - JD_USER, JD_PASS, HEADLESS from .env
 """
 import os
+import re
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,6 +19,7 @@ INVENTORY_URL = "https://extapps.jdpowervalues.com/ValuesOnline/vehicle/"
 # Credentials from environment
 JD_USER = os.getenv("JD_USER", "")
 JD_PASS = os.getenv("JD_PASS", "")
+PW_MASK = '*' * len(JD_PASS)  # For debug output, built once
 
 # Browser settings
 HEADLESS = os.getenv("HEADLESS", "false").lower() in ("true", "1", "yes")
@@ -34,9 +37,38 @@ DOWNLOAD_TIMEOUT = 120000  # 2 minutes
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
 
+# Per-run settings (the GUI passes these directly instead of via os.environ)
+@dataclass(frozen=True, slots=True)
+class RunConfig:
+    """Immutable settings for a single download run."""
+    username: str
+    password: str = field(repr=False)
+    download_folder: str
+    max_downloads: int  # 0 = no limit
+    num_workers: int
+    headless: bool
+    block_resources: bool = True
+    
+    @classmethod
+    def from_env(cls) -> "RunConfig":
+        """Build a RunConfig from the environment (.env / CLI usage)."""
+        return cls(
+            username=JD_USER,
+            password=JD_PASS,
+            download_folder=_download_folder,
+            max_downloads=MAX_DOWNLOADS_PER_RUN,
+            num_workers=int(os.getenv("CONCURRENT_CONTEXTS", "5")),
+            headless=HEADLESS,
+            block_resources=BLOCK_RESOURCES,
+        )
+
+
 # Download directory naming
 from datetime import datetime
 
+# Base folder that dated run directories are created in
+_download_folder = os.getenv("DOWNLOAD_FOLDER", "downloads")
+
 # Cache for run directory to prevent multiple numbered folders
 _run_directory_cache = None
 
@@ -45,6 +77,42 @@ def reset_run_directory_cache():
     global _run_directory_cache
     _run_directory_cache = None
 
+def set_download_folder(folder: str) -> None:
+    """
+    Set the base download folder for this process.
+    
+    The run directory is re-evaluated only if the folder actually changed.
+    """
+    global _download_folder
+    if folder != _download_folder:
+        _download_folder = folder
+        reset_run_directory_cache()
+
+def _has_content(path):
+    """
+    Check whether a run folder already holds results.
+    
+    Covers both layouts: PDFs/tracking.json in the folder itself, or a
+    non-empty pdfs/ or run_data/ subfolder. One os.scandir pass that stops
+    at the first hit, so a folder with thousands of PDFs costs one entry.
+    
+    Returns:
+        bool: False if the folder is missing or has no results
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name == 'tracking.json' or name.endswith('.pdf'):
+                    return True
+                if name in ('pdfs', 'run_data') and entry.is_dir():
+                    with os.scandir(entry.path) as sub:
+                        if next(sub, None) is not None:
+                            return True
+    except FileNotFoundError:
+        return False
+    return False
+
 def get_run_directory():
     """
     Get the run directory for today, creating a numbered folder if needed.
@@ -60,78 +128,34 @@ def get_run_directory():
     if _run_directory_cache is not None:
         return _run_directory_cache
     
-    # Get download base folder from environment variable, default to 'downloads'
-    download_base = os.getenv("DOWNLOAD_FOLDER", "downloads")
+    # Base folder from set_download_folder() / DOWNLOAD_FOLDER, default 'downloads'
+    download_base = _download_folder
     print(f"[CONFIG] Using DOWNLOAD_FOLDER: '{download_base}'")
     
     base_date = datetime.now().strftime('%m-%d-%Y')
     base_path = f"{download_base}/{base_date}"
     
-    # Check if base path exists and has content
-    if not os.path.exists(base_path):
-        # First run of the day
+    # First run of the day, or the folder has no results yet: use it
+    if not _has_content(base_path):
         _run_directory_cache = base_path
         return base_path
     
-    # Check if there are any PDFs or tracking.json in the base path
-    # (Check both old structure and new subfolder structure)
-    has_content = False
-    if os.path.exists(base_path):
-        # Check for old structure (files in root)
-        files = os.listdir(base_path)
-        has_content = any(
-            f.endswith('.pdf') or f == 'tracking.json' 
-            for f in files
-        )
-        
-        # Also check for new structure (subfolders with content)
-        if not has_content:
-            pdf_dir = os.path.join(base_path, 'pdfs')
-            data_dir = os.path.join(base_path, 'run_data')
-            if os.path.exists(pdf_dir) and os.listdir(pdf_dir):
-                has_content = True
-            elif os.path.exists(data_dir) and os.listdir(data_dir):
-                has_content = True
+    # Folder has content: find today's highest numbered folder in one scan
+    pattern = re.compile(rf"^{re.escape(base_date)} \((\d+)\)$")
+    latest_n, latest_path = 1, base_path
+    with os.scandir(download_base) as it:
+        for entry in it:
+            match = pattern.match(entry.name)
+            if match and entry.is_dir() and int(match.group(1)) > latest_n:
+                latest_n = int(match.group(1))
+                latest_path = f"{download_base}/{entry.name}"
     
-    if not has_content:
-        # Folder exists but is empty, use it
-        _run_directory_cache = base_path
-        return base_path
-    
-    # Folder has content, need to create a numbered folder
-    counter = 2
-    while True:
-        numbered_path = f"{download_base}/{base_date} ({counter})"
-        if not os.path.exists(numbered_path):
-            _run_directory_cache = numbered_path
-            return numbered_path
-        
-        # Check if this numbered folder has content (both old and new structure)
-        files = os.listdir(numbered_path)
-        has_content = any(
-            f.endswith('.pdf') or f == 'tracking.json' 
-            for f in files
-        )
-        
-        # Also check new subfolder structure
-        if not has_content:
-            pdf_dir = os.path.join(numbered_path, 'pdfs')
-            data_dir = os.path.join(numbered_path, 'run_data')
-            if os.path.exists(pdf_dir) and os.listdir(pdf_dir):
-                has_content = True
-            elif os.path.exists(data_dir) and os.listdir(data_dir):
-                has_content = True
-        
-        if not has_content:
-            # Found an empty numbered folder, use it
-            _run_directory_cache = numbered_path
-            return numbered_path
-        
-        counter += 1
-        
-        # Safety check to prevent infinite loop
-        if counter > 100:
-            raise RuntimeError("Too many runs for today (>100). Please check downloads folder.")
+    # Reuse it if it has no results yet, otherwise start the next number
+    if latest_n > 1 and not _has_content(latest_path):
+        _run_directory_cache = latest_path
+    else:
+        _run_directory_cache = f"{download_base}/{base_date} ({latest_n + 1})"
+    return _run_directory_cache
 
 # Format: MM-DD-YYYY (e.g., 10-01-2025)
 TODAY_FOLDER = datetime.now().strftime('%m-%d-%Y')
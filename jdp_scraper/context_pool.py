@@ -5,8 +5,47 @@ Manages a pool of browser contexts for efficient parallel task execution.
 """
 
 import asyncio
-from typing import List
-from playwright.async_api import Browser, BrowserContext
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+from playwright.async_api import Browser, BrowserContext, Page, Request, Route
+from jdp_scraper import config
+from jdp_scraper.auth_async import login_async
+from jdp_scraper.license_page_async import accept_license_async
+
+# Resource types blocked for speed. Matched on resource type rather than
+# URL so assets served without a file extension are caught too.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'imageset', 'stylesheet', 'font', 'media'})
+
+# Static assets recognisable from the URL alone skip the type check above
+BLOCKED_URL_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,css,woff,woff2,ttf,mp4,webm}"
+
+
+async def abort_route(route: Route) -> None:
+    """Route handler: abort unconditionally."""
+    await route.abort()
+
+
+async def block_resource_handler(route: Route, request: Request) -> None:
+    """Route handler: abort blocked resource types, let everything else through."""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def route_resource_blocking(context: BrowserContext) -> None:
+    """
+    Register the resource-blocking routes on a context.
+    
+    Playwright tries the most recently registered route first, so asset
+    URLs matching BLOCKED_URL_GLOB go straight to the abort-only handler
+    and only the remaining requests reach the resource-type catch-all.
+    
+    Args:
+        context: The browser context to configure
+    """
+    await context.route("**/*", block_resource_handler)
+    await context.route(BLOCKED_URL_GLOB, abort_route)
 
 
 class ContextPool:
@@ -14,18 +53,19 @@ class ContextPool:
     Manages a pool of browser contexts for parallel task execution.
     
     Features:
-    - Round-robin context distribution
+    - Optional single login, shared by every context through its storage state
+    - Exclusive leases on idle contexts (or round-robin distribution)
     - Resource blocking (images, CSS, fonts) for performance
-    - Thread-safe context access
+    - Lock-free context access (safe for concurrent tasks on one loop)
     - Automatic cleanup
     
     Example:
-        pool = ContextPool(browser, num_contexts=5, block_resources=True)
-        await pool.initialize()
+        pool = ContextPool(browser, num_contexts=5, block_resources=True,
+                           username=user, password=pw)
+        await pool.initialize()  # Logs in once, shared by all contexts
         
-        context = await pool.get_context()
-        page = await context.new_page()
-        # Use page...
+        async with pool.new_page() as page:
+            # Use page... (closed again on exit)
         
         await pool.close_all()
     """
@@ -34,7 +74,10 @@ class ContextPool:
         self,
         browser: Browser,
         num_contexts: int = 5,
-        block_resources: bool = True
+        block_resources: bool = True,
+        storage_state: Optional[dict] = None,
+        username: str = None,
+        password: str = None
     ):
         """
         Initialize the context pool.
@@ -43,14 +86,23 @@ class ContextPool:
             browser: Playwright browser instance
             num_contexts: Number of contexts to create in the pool
             block_resources: Whether to block images/CSS/fonts for performance
+            storage_state: Signed-in state (cookies/localStorage) to start
+                every context with
+            username: Username to log in with. If credentials are given
+                and storage_state is None, initialize() logs in once and
+                shares that session; otherwise contexts start signed out
+            password: Password to log in with (default: environment)
         """
         self.browser = browser
         self.num_contexts = num_contexts
         self.block_resources = block_resources
+        self.storage_state = storage_state
+        self.username = username
+        self.password = password
         
         self.contexts: List[BrowserContext] = []
+        self._available: Optional[asyncio.Queue] = None
         self._current_index = 0
-        self._lock = asyncio.Lock()
         self._initialized = False
         
     async def initialize(self) -> None:
@@ -63,21 +115,58 @@ class ContextPool:
             print("[CONTEXT_POOL] Already initialized")
             return
             
+        # Log in once and restore that session into every context, instead
+        # of logging each context in separately (only when asked to)
+        if self.storage_state is None and (self.username is not None or self.password is not None):
+            self.storage_state = await self._login_once()
+        
         print(f"[CONTEXT_POOL] Initializing {self.num_contexts} contexts...")
         
-        for i in range(self.num_contexts):
-            context = await self.browser.new_context()
+        async def create_context(i: int) -> BrowserContext:
+            context = await self.browser.new_context(storage_state=self.storage_state)
             
             # Block resources for performance if enabled
             if self.block_resources:
                 await self._setup_resource_blocking(context)
                 
-            self.contexts.append(context)
             print(f"[CONTEXT_POOL] Created context {i + 1}/{self.num_contexts}")
+            return context
+        
+        # Create all contexts concurrently instead of one round-trip at a time
+        self.contexts = list(await asyncio.gather(
+            *(create_context(i) for i in range(self.num_contexts))
+        ))
+        
+        # Contexts not currently leased out
+        self._available = asyncio.Queue()
+        for context in self.contexts:
+            self._available.put_nowait(context)
             
         self._initialized = True
         print(f"[CONTEXT_POOL] Initialization complete")
         
+    async def _login_once(self) -> dict:
+        """
+        Log in on a throwaway context and capture its storage state.
+        
+        Returns:
+            Storage state (cookies and localStorage) of the signed-in session
+            
+        Raises:
+            RuntimeError: If the login fails
+        """
+        print("[CONTEXT_POOL] Logging in once to share the session...")
+        boot_context = await self.browser.new_context()
+        try:
+            page = await boot_context.new_page()
+            await page.goto(config.LOGIN_URL, wait_until="domcontentloaded", timeout=config.NAVIGATION_TIMEOUT)
+            if not await login_async(page, self.username, self.password):
+                raise RuntimeError("Context pool login failed")
+            await accept_license_async(page)
+            return await boot_context.storage_state()
+        finally:
+            await boot_context.close()
+        
     async def _setup_resource_blocking(self, context: BrowserContext) -> None:
         """
         Set up resource blocking for a context to improve performance.
@@ -87,21 +176,15 @@ class ContextPool:
         Args:
             context: The browser context to configure
         """
-        async def block_handler(route, request):
-            """Block certain resource types."""
-            resource_type = request.resource_type
-            
-            if resource_type in ['image', 'imageset', 'stylesheet', 'font', 'media']:
-                await route.abort()
-            else:
-                await route.continue_()
-                
-        await context.route("**/*", block_handler)
+        await route_resource_blocking(context)
         
     async def get_context(self) -> BrowserContext:
         """
         Get the next available context using round-robin distribution.
         
+        Lock-free: there is no await between reading and advancing the
+        index, so no other task can interleave on the event loop.
+        
         Returns:
             A browser context from the pool
             
@@ -111,11 +194,59 @@ class ContextPool:
         if not self._initialized:
             raise RuntimeError("Context pool not initialized. Call initialize() first.")
             
-        async with self._lock:
-            context = self.contexts[self._current_index]
-            self._current_index = (self._current_index + 1) % self.num_contexts
-            return context
+        context = self.contexts[self._current_index]
+        self._current_index = (self._current_index + 1) % self.num_contexts
+        return context
+            
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[BrowserContext]:
+        """
+        Lease an idle context for exclusive use.
+        
+        Waits until a context is free, so no context is ever shared by more
+        than one caller at a time; get_context() hands contexts out
+        round-robin even if they are still busy.
+        
+        Yields:
+            A browser context, returned to the pool on exit
+            
+        Raises:
+            RuntimeError: If the pool is not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError("Context pool not initialized. Call initialize() first.")
+            
+        available = self._available
+        context = await available.get()
+        try:
+            yield context
+        finally:
+            # close_all() may have run meanwhile; don't hand back a closed context
+            if self._available is available:
+                available.put_nowait(context)
             
+    @asynccontextmanager
+    async def new_page(self) -> AsyncIterator[Page]:
+        """
+        Open a page in a leased context and close it when done.
+        
+        Pages left open keep their DOM, JS heap and network state alive in
+        the context, so long runs should use this rather than calling
+        context.new_page() directly.
+        
+        Yields:
+            A new page, closed (and its context returned) on exit
+        """
+        async with self.lease() as context:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception as e:
+                    print(f"[CONTEXT_POOL] Error closing page: {e}")
+                    
     async def get_context_by_index(self, index: int) -> BrowserContext:
         """
         Get a specific context by index.
@@ -149,14 +280,16 @@ class ContextPool:
             
         print(f"[CONTEXT_POOL] Closing {len(self.contexts)} contexts...")
         
-        for i, context in enumerate(self.contexts):
-            try:
-                await context.close()
-                print(f"[CONTEXT_POOL] Closed context {i + 1}/{len(self.contexts)}")
-            except Exception as e:
-                print(f"[CONTEXT_POOL] Error closing context {i}: {e}")
+        results = await asyncio.gather(
+            *(context.close() for context in self.contexts),
+            return_exceptions=True
+        )
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"[CONTEXT_POOL] Error closing context {i}: {result}")
                 
         self.contexts.clear()
+        self._available = None
         self._initialized = False
         print("[CONTEXT_POOL] All contexts closed")
         
@@ -180,6 +313,7 @@ class ContextPool:
             for context in self.contexts:
                 page_counts.append(len(context.pages))
                 
+            stats['idle_contexts'] = self._available.qsize()
             stats['total_pages'] = sum(page_counts)
             stats['pages_per_context'] = page_counts
             stats['avg_pages_per_context'] = sum(page_counts) / len(page_counts) if page_counts else 0
@@ -198,6 +332,7 @@ class ContextPool:
         print(f"Resource blocking  : {stats['block_resources']}")
         
         if stats['initialized']:
+            print(f"Idle contexts      : {stats['idle_contexts']}")
             print(f"Total pages        : {stats['total_pages']}")
             print(f"Avg pages/context  : {stats['avg_pages_per_context']:.1f}")
             print(f"Current index      : {stats['current_index']}")
@@ -1,8 +1,23 @@
-"""Logging configuration placeholders.
+"""Logging configuration.
 
 TODO:
-- Configure structured logging (level, format)
-- Add file/console handlers
+- Add file handlers
 - Add helper to log navigation and downloads
 """
+import logging
+import os
+import sys
 
+
+def configure_logging() -> None:
+    """
+    Send log records to the console alongside the existing print() output.
+    
+    The level comes from LOG_LEVEL (default INFO), so debug detail such as
+    the login field values is skipped unless LOG_LEVEL=DEBUG.
+    """
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
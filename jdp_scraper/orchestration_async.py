@@ -4,12 +4,13 @@ High-level control flow using Playwright async API with single context, multiple
 Implements pre-assignment strategy to prevent duplicate downloads.
 """
 import asyncio
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from jdp_scraper import config
 from jdp_scraper.async_utils import AsyncSemaphorePool
 from jdp_scraper.page_pool import PagePool
+from jdp_scraper.context_pool import route_resource_blocking
 from jdp_scraper.task_queue import AsyncTaskQueue
 from jdp_scraper.checkpoint import ProgressCheckpoint
 from jdp_scraper.metrics import RunMetrics
@@ -95,16 +96,7 @@ async def setup_resource_blocking(context: BrowserContext) -> None:
     Args:
         context: The browser context to configure
     """
-    async def block_handler(route, request):
-        """Block certain resource types."""
-        resource_type = request.resource_type
-        
-        if resource_type in ['image', 'imageset', 'stylesheet', 'font', 'media']:
-            await route.abort()
-        else:
-            await route.continue_()
-            
-    await context.route("**/*", block_handler)
+    await route_resource_blocking(context)
     print("[RESOURCE_BLOCKING] Enabled (CSS/images/fonts blocked)")
 
 
@@ -320,13 +312,21 @@ async def logout_async(page: Page) -> None:
         print(f"[LOGOUT] Logout failed (not critical): {e}")
 
 
-async def run_async(username: str = None, password: str = None) -> None:
+async def run_async(
+    username: str = None,
+    password: str = None,
+    progress_callback: Optional[Callable[[ProgressCheckpoint, str, str], None]] = None,
+    run_config: Optional[config.RunConfig] = None
+) -> None:
     """
     Main async orchestration function for parallel PDF downloads.
     
     Args:
-        username: Username for login (overrides environment variable)
-        password: Password for login (overrides environment variable)
+        username: Username for login (overrides run_config/environment)
+        password: Password for login (overrides run_config/environment)
+        progress_callback: Optional function called after each vehicle as
+            callback(checkpoint, reference_number, status)
+        run_config: Settings for this run (default: built from environment)
     
     This function:
     1. Launches browser (headless)
@@ -337,21 +337,34 @@ async def run_async(username: str = None, password: str = None) -> None:
     6. Processes vehicles in parallel
     7. Cleans up and reports
     """
+    if run_config is None:
+        run_config = config.RunConfig.from_env()
+    if username is None:
+        username = run_config.username
+    if password is None:
+        password = run_config.password
+    
+    # Must happen before anything resolves the run directory
+    config.set_download_folder(run_config.download_folder)
+    
     # Initialize metrics and checkpoint
     metrics = RunMetrics()
-    checkpoint = ProgressCheckpoint()
+    checkpoint = ProgressCheckpoint(progress_callback=progress_callback)
     
     # Get number of pages (workers)
-    num_pages = int(os.getenv("CONCURRENT_CONTEXTS", "5"))
+    num_pages = run_config.num_workers
+    
+    # 0 = no limit
+    max_downloads = run_config.max_downloads or None
     
     print("\n" + "="*60)
     print("JD POWER PDF DOWNLOADER - PARALLEL VERSION")
     print("="*60)
-    print(f"Run directory      : {config.RUN_DIR}")
-    print(f"Max downloads      : {config.MAX_DOWNLOADS_PER_RUN}")
+    print(f"Run directory      : {config.get_run_directory()}")
+    print(f"Max downloads      : {max_downloads or 'all'}")
     print(f"Parallel pages     : {num_pages}")
-    print(f"Headless mode      : {config.HEADLESS}")
-    print(f"Block resources    : {config.BLOCK_RESOURCES} (CSS/images/fonts)")
+    print(f"Headless mode      : {run_config.headless}")
+    print(f"Block resources    : {run_config.block_resources} (CSS/images/fonts)")
     print("="*60 + "\n")
     
     async with async_playwright() as p:
@@ -363,8 +376,8 @@ async def run_async(username: str = None, password: str = None) -> None:
         try:
             # Launch browser
             print("[BROWSER] Launching browser...")
-            browser = await p.chromium.launch(headless=config.HEADLESS)
-            print(f"[BROWSER] Browser launched (headless={config.HEADLESS})")
+            browser = await p.chromium.launch(headless=run_config.headless)
+            print(f"[BROWSER] Browser launched (headless={run_config.headless})")
             
             # Create single context (WITHOUT resource blocking initially)
             print("\n[CONTEXT] Creating single browser context...")
@@ -400,7 +413,7 @@ async def run_async(username: str = None, password: str = None) -> None:
                 raise Exception("Failed to export CSV")
             
             # NOW apply resource blocking for parallel processing (after CSV export)
-            if config.BLOCK_RESOURCES:
+            if run_config.block_resources:
                 print("\n[RESOURCE_BLOCKING] Enabling resource blocking for parallel processing...")
                 await setup_resource_blocking(context)
                 print("[RESOURCE_BLOCKING] All new pages will have CSS/images blocked for speed")
@@ -420,7 +433,7 @@ async def run_async(username: str = None, password: str = None) -> None:
             pending_refs = [
                 ref for ref, status in tracking.items()
                 if status is None
-            ][:config.MAX_DOWNLOADS_PER_RUN]
+            ][:max_downloads]
             
             print(f"\n[PROCESSING] {len(pending_refs)} vehicles to process")
             
@@ -515,6 +528,10 @@ async def run_async(username: str = None, password: str = None) -> None:
                 await browser.close()
                 print("[CLEANUP] Browser closed")
             
+            # Write the last partial checkpoint batch, stop the writer thread
+            # and release checkpoint.log (a second GUI run makes a new one)
+            await asyncio.to_thread(checkpoint.close)
+            
             # Finalize metrics
             total_inventory = len(all_refs) if 'all_refs' in locals() else 0
             attempted = len(pending_refs) if 'pending_refs' in locals() else 0
@@ -539,7 +556,3 @@ async def run_async(username: str = None, password: str = None) -> None:
             metrics.print_console_report(checkpoint_data=checkpoint.get_status())
             
             print("\n[EXIT] Program complete")
-
-
-# Import os for environment variable
-import os
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Batch launcher templates shared by the packaging scripts.
+
+Templates use str.format_map placeholders ({exe_name}); batch variables
+such as %SCRIPT_DIR% pass through untouched.
+"""
+
+from pathlib import Path
+
+# Launcher that verifies the browser folder and Chromium before starting
+FIXED_LAUNCHER = '''@echo off
+REM JDPowerDownloader Launcher - Fixed Version
+REM This script sets up the environment and launches the application
+
+echo Starting JDPowerDownloader...
+echo Setting up browser environment...
+
+REM Get the directory where this script is located
+set SCRIPT_DIR=%~dp0
+
+REM Set Playwright browser path to the ms-playwright folder in the same directory
+set PLAYWRIGHT_BROWSERS_PATH=%SCRIPT_DIR%ms-playwright
+
+echo Browser path set to: %PLAYWRIGHT_BROWSERS_PATH%
+
+REM Verify the browser path exists
+if not exist "%PLAYWRIGHT_BROWSERS_PATH%" (
+    echo ERROR: Browser folder not found at: %PLAYWRIGHT_BROWSERS_PATH%
+    echo Please make sure the ms-playwright folder is in the same directory as this script.
+    echo.
+    echo Available files in this directory:
+    dir /b
+    echo.
+    pause
+    exit /b 1
+)
+
+echo Browser folder found. Checking for Chromium...
+
+REM Check for Chromium specifically (whichever chromium-* revision is bundled)
+set CHROMIUM_DIR=%PLAYWRIGHT_BROWSERS_PATH%\\chromium-missing
+for /d %%D in ("%PLAYWRIGHT_BROWSERS_PATH%\\chromium-*") do set CHROMIUM_DIR=%%D
+set CHROMIUM_PATH=%CHROMIUM_DIR%\\chrome-win\\chrome.exe
+if not exist "%CHROMIUM_PATH%" (
+    echo ERROR: Chromium browser not found at: %CHROMIUM_PATH%
+    echo Available browsers:
+    dir /b "%PLAYWRIGHT_BROWSERS_PATH%"
+    echo.
+    pause
+    exit /b 1
+)
+
+echo Chromium browser found. Launching application...
+
+REM Launch the application
+"%SCRIPT_DIR%{exe_name}"
+
+echo Application has closed.
+pause
+'''
+
+# Launcher that keeps the console open so the app's output can be read
+DEBUG_LAUNCHER = '''@echo off
+REM JDPowerDownloader Debug Launcher
+REM This version shows console output to help debug issues
+
+echo Starting JDPowerDownloader Debug Version...
+echo This version will show console output to help debug issues.
+echo.
+
+REM Get the directory where this script is located
+set SCRIPT_DIR=%~dp0
+
+REM Set Playwright browser path to the ms-playwright folder in the same directory
+set PLAYWRIGHT_BROWSERS_PATH=%SCRIPT_DIR%ms-playwright
+
+echo Browser path set to: %PLAYWRIGHT_BROWSERS_PATH%
+
+REM Verify the browser path exists
+if not exist "%PLAYWRIGHT_BROWSERS_PATH%" (
+    echo ERROR: Browser folder not found at: %PLAYWRIGHT_BROWSERS_PATH%
+    echo Please make sure the ms-playwright folder is in the same directory as this script.
+    pause
+    exit /b 1
+)
+
+echo Browser folder found. Launching application...
+echo.
+echo NOTE: You will see console output that will help identify any issues.
+echo.
+
+REM Launch the application (this will show console output)
+REM We need to run the executable directly to see console output
+cd /d "%SCRIPT_DIR%"
+{exe_name}
+
+echo.
+echo Application has closed.
+pause
+'''
+
+def write_launcher(path, template, exe_name='JDPowerDownloader.exe', **kw):
+    """Fill in a launcher template and write it with Windows line endings.
+    
+    Args:
+        path: Destination .bat file
+        template: One of the *_LAUNCHER templates
+        exe_name: Executable the launcher starts
+        **kw: Any further template placeholders
+    
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    path.write_text(template.format_map(dict(kw, exe_name=exe_name)),
+                    encoding='utf-8', newline='\r\n')
+    return path
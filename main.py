@@ -2,8 +2,10 @@
 
 This script launches the orchestration flow to automate PDF downloads.
 """
+from jdp_scraper.logging_utils import configure_logging
 from jdp_scraper.orchestration import run
 
 if __name__ == "__main__":
+    configure_logging()
     run()
 
@@ -5,6 +5,7 @@ This script uses asyncio.run() which BLOCKS until all processing is complete.
 The script will NOT exit until all work is done.
 """
 import asyncio
+from jdp_scraper.logging_utils import configure_logging
 from jdp_scraper.orchestration_async import run_async
 
 
@@ -14,6 +15,8 @@ def main():
     
     This function blocks until run_async() completes all work.
     """
+    configure_logging()
+    
     try:
         print("[STARTUP] Starting parallel PDF downloader...")
         print("[STARTUP] This script will block until all processing is complete")
@@ -10,7 +10,15 @@ import os
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Windowed builds (no console) start with sys.stdout/sys.stderr set to None;
+# give stray prints from the downloader somewhere harmless to go
+if sys.stdout is None:
+    sys.stdout = open(os.devnull, 'w')
+if sys.stderr is None:
+    sys.stderr = open(os.devnull, 'w')
+
 from app.gui import JDPowerApp
+from jdp_scraper.logging_utils import configure_logging
 
 
 def check_dependencies():
@@ -36,6 +44,8 @@ def check_dependencies():
 
 def main():
     """Main entry point for the GUI application."""
+    configure_logging()
+    
     # Check dependencies
     success, error_msg = check_dependencies()
     if not success:
@@ -0,0 +1,15 @@
+"""
+PyInstaller runtime hook: point Playwright at the bundled browsers.
+
+Runs inside the frozen app before main_gui, so the distribution needs no
+batch launcher to set PLAYWRIGHT_BROWSERS_PATH. An ms-playwright folder
+next to the executable wins over one bundled inside it; an explicit
+PLAYWRIGHT_BROWSERS_PATH from the environment is left alone.
+"""
+import os
+import sys
+
+for _base in (os.path.dirname(sys.executable), getattr(sys, '_MEIPASS', None)):
+    if _base and os.path.isdir(os.path.join(_base, 'ms-playwright')):
+        os.environ.setdefault('PLAYWRIGHT_BROWSERS_PATH', os.path.join(_base, 'ms-playwright'))
+        break
@@ -0,0 +1,191 @@
+"""
+Tests for checkpoint crash recovery and run-folder selection.
+
+Covers:
+1. Replaying checkpoint.log after a crash in the middle of a batch
+2. Ignoring a torn last line in checkpoint.log
+3. Skipping log lines the checkpoint.json snapshot already covers
+4. Saving after close() without waiting on the stopped writer
+5. Picking the next "DATE (n)" run folder from one directory scan
+
+Run with: python -m pytest test_checkpoint_recovery.py
+"""
+import asyncio
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+
+from jdp_scraper import checkpoint as checkpoint_module
+from jdp_scraper import config
+from jdp_scraper.checkpoint import ProgressCheckpoint
+
+
+def _log_lines(path):
+    with open(path) as f:
+        return f.read().splitlines()
+
+
+def _wait_until(condition, timeout=5.0):
+    """Poll the file system until the writer thread has caught up."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "checkpoint files never reached the expected state"
+        time.sleep(0.01)
+
+
+def _write_snapshot(path, **fields):
+    data = {
+        'consecutive_failures': 0,
+        'last_successful_ref': None,
+        'total_processed': 0,
+        'total_succeeded': 0,
+        'total_failed': 0,
+        'browser_restarts': 0,
+        'started_at': '2025-10-01T00:00:00',
+        'last_checkpoint_at': None,
+    }
+    data.update(fields)
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+def test_replay_after_crash_mid_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(checkpoint_module, 'SAVE_EVERY', 3)
+    live_dir = tmp_path / 'live'
+    crash_dir = tmp_path / 'crash'
+    live_file = str(live_dir / 'checkpoint.json')
+
+    def snapshot_total():
+        try:
+            with open(live_file) as f:
+                return json.load(f)['total_processed']
+        except (OSError, ValueError):
+            return None
+
+    async def run():
+        checkpoint = ProgressCheckpoint(checkpoint_file=live_file)
+        try:
+            for ref in ('R1', 'R2', 'R3', 'R4'):
+                await checkpoint.record_success(ref)
+            await checkpoint.record_failure('R5')
+            # Snapshot covers the first batch of 3, the log holds the other 2
+            _wait_until(lambda: snapshot_total() == 3
+                        and len(_log_lines(live_dir / 'checkpoint.log')) == 2)
+            # What a killed process would leave on disk
+            shutil.copytree(live_dir, crash_dir)
+        finally:
+            checkpoint.close()
+
+    asyncio.run(run())
+
+    restored = ProgressCheckpoint(checkpoint_file=str(crash_dir / 'checkpoint.json'))
+    try:
+        assert restored.total_processed == 5
+        assert restored.total_succeeded == 4
+        assert restored.total_failed == 1
+        assert restored.consecutive_failures == 1
+        assert restored.last_successful_ref == 'R4'
+    finally:
+        restored.close()
+
+
+def test_torn_last_log_line_is_ignored(tmp_path):
+    checkpoint_file = str(tmp_path / 'checkpoint.json')
+    with open(tmp_path / 'checkpoint.log', 'w') as f:
+        f.write('{"s":"R1","n":1}\n{"s":"R2","n":2}\n{"s":"R3","n"')
+
+    restored = ProgressCheckpoint(checkpoint_file=checkpoint_file)
+    try:
+        assert restored.total_processed == 2
+        assert restored.last_successful_ref == 'R2'
+    finally:
+        restored.close()
+
+
+def test_log_lines_covered_by_snapshot_are_skipped(tmp_path):
+    checkpoint_file = str(tmp_path / 'checkpoint.json')
+    _write_snapshot(checkpoint_file, total_processed=2, total_succeeded=2, last_successful_ref='R2')
+    # Crash between writing the snapshot and truncating the log
+    with open(tmp_path / 'checkpoint.log', 'w') as f:
+        f.write('{"s":"R1","n":1}\n{"s":"R2","n":2}\n{"f":"R3","n":3}\n')
+
+    restored = ProgressCheckpoint(checkpoint_file=checkpoint_file)
+    try:
+        assert restored.total_processed == 3
+        assert restored.total_succeeded == 2
+        assert restored.total_failed == 1
+    finally:
+        restored.close()
+
+    # close() folds the replayed result into the snapshot and empties the log
+    with open(checkpoint_file) as f:
+        assert json.load(f)['total_processed'] == 3
+    assert os.path.getsize(tmp_path / 'checkpoint.log') == 0
+
+
+def test_save_after_close(tmp_path):
+    checkpoint_file = str(tmp_path / 'checkpoint.json')
+
+    async def run():
+        checkpoint = ProgressCheckpoint(checkpoint_file=checkpoint_file)
+        await checkpoint.record_success('R1')
+        checkpoint.close()
+        # The writer thread is gone; these must be written, not hang
+        await checkpoint.record_success('R2')
+        assert await asyncio.wait_for(checkpoint.save(), timeout=5)
+        assert await asyncio.wait_for(checkpoint.flush(), timeout=5)
+
+    asyncio.run(run())
+
+    with open(checkpoint_file) as f:
+        data = json.load(f)
+    assert data['total_processed'] == 2
+    assert data['last_successful_ref'] == 'R2'
+    assert os.path.getsize(tmp_path / 'checkpoint.log') == 0
+
+
+def _run_directory(download_base):
+    config.set_download_folder(str(download_base))
+    config.reset_run_directory_cache()
+    return config.get_run_directory()
+
+
+def _make_run(path, with_results):
+    os.makedirs(os.path.join(path, 'pdfs'))
+    if with_results:
+        open(os.path.join(path, 'pdfs', '100.pdf'), 'w').close()
+
+
+def test_run_directory_numbering(tmp_path, monkeypatch):
+    # Put config's module state back afterwards
+    monkeypatch.setattr(config, '_download_folder', config._download_folder)
+    monkeypatch.setattr(config, '_run_directory_cache', config._run_directory_cache)
+    base = str(tmp_path)
+    today = datetime.now().strftime('%m-%d-%Y')
+
+    # First run of the day
+    assert _run_directory(base) == f"{base}/{today}"
+
+    # Today's folder exists but has no results yet: reuse it
+    _make_run(f"{base}/{today}", with_results=False)
+    assert _run_directory(base) == f"{base}/{today}"
+
+    # Folder has results: next number
+    open(f"{base}/{today}/pdfs/100.pdf", 'w').close()
+    assert _run_directory(base) == f"{base}/{today} (2)"
+
+    # Highest number is compared numerically, and reused while empty
+    _make_run(f"{base}/{today} (2)", with_results=True)
+    _make_run(f"{base}/{today} (9)", with_results=True)
+    _make_run(f"{base}/{today} (10)", with_results=False)
+    assert _run_directory(base) == f"{base}/{today} (10)"
+
+    # Once it has results too, the run after it gets the next number
+    open(f"{base}/{today} (10)/pdfs/100.pdf", 'w').close()
+    assert _run_directory(base) == f"{base}/{today} (11)"
+
+    # Other days' folders are ignored
+    _make_run(f"{base}/01-01-2020 (50)", with_results=True)
+    assert _run_directory(base) == f"{base}/{today} (11)"